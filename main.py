@@ -8,31 +8,28 @@ import os
 import sys
 
 from src.cli.arguments import parse_arguments, resolve_paths, validate_arguments
-from src.commands.editor import run_editor
-from src.commands.prepare_export import (
-    run_prepare_export_direct,
-    run_prepare_export_directory,
-)
-from src.commands.process_images import run_image_processing
-from src.commands.process_psd import run_psd_processing
-from src.config import ConfigHandler
 from src.logger import setup_logger
 
 
-def main() -> None:
-    """Main entry point for the application."""
+def main() -> int:
+    """Main entry point for the application.
+
+    Returns:
+        Process exit code: 0 on success, 1 on failure.
+    """
     # Setup logging
     logger = setup_logger()
 
     # Parse and validate command line arguments
     args = parse_arguments()
-    validate_arguments(args, logger)
+    if not validate_arguments(args, logger):
+        return 1
 
     # Handle --list-indesign-versions (standalone command)
     if getattr(args, "list_indesign_versions", False):
         from adobe_document_handler import InDesignProcessor
         InDesignProcessor.list_available_versions()
-        return
+        return 0
 
     screenshot_filter = args.screenshot
     language_filter = args.language
@@ -41,19 +38,26 @@ def main() -> None:
 
     # Handle direct path mode for prepare-and-export
     if prepare_and_export and args.file and args.output:
-        run_prepare_export_direct(args.file, args.output, logger)
-        return
+        from src.cache import resolve_cache_dir
+        from src.commands.prepare_export import run_prepare_export_direct
+        return run_prepare_export_direct(
+            args.file, args.output, logger,
+            cache_dir=resolve_cache_dir(args.cache_dir, args.no_cache),
+        )
 
     # Handle editor mode
     if args.editor:
         if not args.directory:
             logger.error("--editor requires --directory to be specified")
-            sys.exit(1)
-        run_editor(args.directory, logger)
-        return
+            return 1
+        from src.commands.editor import run_editor
+        return run_editor(args.directory, logger)
 
     # Resolve paths from arguments
-    config_file, input_dir, locales_dir, output_dir = resolve_paths(args, logger)
+    paths = resolve_paths(args, logger)
+    if paths is None:
+        return 1
+    config_file, input_dir, locales_dir, output_dir = paths
 
     # Build log message with filters
     log_parts: list[str] = []
@@ -72,52 +76,67 @@ def main() -> None:
     # Check if input directory exists
     if not os.path.isdir(input_dir):
         logger.error(f"Input directory '{input_dir}' does not exist")
-        sys.exit(1)
+        return 1
 
     # Handle directory-based prepare-and-export mode
     if prepare_and_export:
-        run_prepare_export_directory(input_dir, output_dir, screenshot_filter, logger)
-        return
+        from src.cache import resolve_cache_dir
+        from src.commands.prepare_export import run_prepare_export_directory
+        return run_prepare_export_directory(
+            input_dir, output_dir, screenshot_filter, logger,
+            cache_dir=resolve_cache_dir(args.cache_dir, args.no_cache),
+        )
+
+    # Heavy imports (Pillow, document handlers) are only needed from here on
+    from src.commands.process_images import (
+        load_config,
+        load_locales,
+        run_image_processing,
+    )
+
+    # Load configuration and locales once; they are shared by image and PSD processing
+    config_handler = load_config(config_file, logger)
+    locale_handler = load_locales(locales_dir, language_filter, logger)
 
     # Run image processing pipeline
     run_image_processing(
         config_file=config_file,
+        config_handler=config_handler,
         input_dir=input_dir,
-        locales_dir=locales_dir,
+        locale_handler=locale_handler,
         output_dir=output_dir,
         screenshot_filter=screenshot_filter,
-        language_filter=language_filter,
         skip_existing=skip_existing,
         logger=logger,
     )
 
-    # Get text_settings for PSD processing (need to reload config)
+    # Get text_settings for PSD processing from the already loaded config
     text_settings = None
-    if os.path.isfile(config_file):
+    crop_settings = None
+    if config_handler is not None:
         try:
-            config_handler = ConfigHandler(config_file)
             text_settings = config_handler.get_text_settings()
             crop_settings = config_handler.get_crop_settings()
         except Exception:
+            text_settings = None
             crop_settings = None
-    else:
-        crop_settings = None
 
     # Run PSD processing only if ImageProcessor was skipped (no crop settings)
     if not crop_settings:
+        from src.commands.process_psd import run_psd_processing
         run_psd_processing(
             input_dir=input_dir,
             output_dir=output_dir,
-            locales_dir=locales_dir,
+            locale_handler=locale_handler,
             screenshot_filter=screenshot_filter,
-            language_filter=language_filter,
             skip_existing=skip_existing,
             text_settings=text_settings,
             logger=logger,
         )
 
     logger.info("All operations finished.")
+    return 0
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
@@ -0,0 +1,108 @@
+"""
+Template export cache for the Screenshot Cropper application.
+"""
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+from typing import Callable
+
+logger = logging.getLogger("screenshot_cropper")
+
+# Default location for the records of up-to-date template exports
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "screenshot-cropper")
+
+
+def resolve_cache_dir(cache_dir: str | None, no_cache: bool) -> str | None:
+    """Resolve the template cache directory from command line options.
+
+    Args:
+        cache_dir: Directory given with --cache-dir, or None for the default.
+        no_cache: Whether --no-cache was given.
+
+    Returns:
+        Cache directory to use, or None if caching is disabled.
+    """
+    if no_cache:
+        return None
+    return cache_dir or DEFAULT_CACHE_DIR
+
+
+def _cache_path(cache_dir: str, design_file: str, output_json: str) -> str:
+    """Get the marker path for the current state of an export.
+
+    The key covers the design file (absolute path, mtime and size) and the
+    content of the output JSON, so it only matches while both are exactly
+    as the last successful export left them.
+
+    Args:
+        cache_dir: Directory holding the markers.
+        design_file: Path to the PSD or INDD file.
+        output_json: Path for the output JSON file.
+
+    Returns:
+        Path of the marker file.
+    """
+    stat = os.stat(design_file)
+    key = hashlib.sha1(
+        f"{os.path.abspath(design_file)}\0{stat.st_mtime_ns}\0{stat.st_size}\0".encode("utf-8")
+    )
+    try:
+        with open(output_json, "rb") as f:
+            key.update(f.read())
+    except FileNotFoundError:
+        # Never matches a marker, which is only written after an export
+        key.update(b"\0missing")
+    return os.path.join(cache_dir, key.hexdigest())
+
+
+def cached_template(
+    design_file: str,
+    output_json: str,
+    builder: Callable[[str, str], bool],
+    cache_dir: str | None = DEFAULT_CACHE_DIR,
+) -> bool:
+    """Export a template unless it is already up to date.
+
+    After a successful export an empty marker is stored under a digest of
+    the prepared design file and the output JSON. If the marker exists, the
+    output is exactly what the export would produce and the builder is not
+    called. Any change to either file, including a deleted or moved output
+    JSON, misses and exports again.
+
+    Preparing a document renames its text layers and saves it, so only the
+    prepared state is ever recorded. A document that has not been prepared
+    (e.g. a fresh copy of the original file) never matches and is always
+    exported.
+
+    Args:
+        design_file: Path to the PSD or INDD file.
+        output_json: Path for the output JSON file.
+        builder: Callable that exports the template, e.g. a processor's
+            prepare_and_export_template. Returns True on success.
+        cache_dir: Directory holding the markers, or None to disable
+            caching.
+
+    Returns:
+        True if the template is up to date or was written, False otherwise.
+    """
+    if cache_dir is None:
+        return builder(design_file, output_json)
+
+    if os.path.isfile(_cache_path(cache_dir, design_file, output_json)):
+        logger.info(f"Template for '{design_file}' is up to date, skipping export")
+        return True
+
+    success = builder(design_file, output_json)
+    if not success:
+        return False
+
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        # Key on the state after the export: the prepared document and the
+        # template it produced
+        open(_cache_path(cache_dir, design_file, output_json), "wb").close()
+    except OSError as e:
+        logger.warning(f"Could not record template export in cache '{cache_dir}': {e}")
+    return True
@@ -2,16 +2,18 @@
 from __future__ import annotations
 
 import argparse
+import functools
 import logging
 import os
 import sys
 
 
-def parse_arguments() -> argparse.Namespace:
-    """Parse command line arguments.
+@functools.lru_cache(maxsize=1)
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the command line argument parser.
 
     Returns:
-        Parsed arguments namespace.
+        Configured argument parser.
     """
     parser = argparse.ArgumentParser(
         description="Crop screenshots based on JSON configuration."
@@ -63,17 +65,46 @@ def parse_arguments() -> argparse.Namespace:
         action="store_true",
         help="Launch visual editor to configure positions and sizes"
     )
-    return parser.parse_args()
+    parser.add_argument(
+        "--cache-dir",
+        help="Directory recording up-to-date prepare-and-export templates "
+             "(default: ~/.cache/screenshot-cropper)"
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Always re-export templates with --prepare-and-export, ignoring the cache"
+    )
+    return parser
+
+
+@functools.lru_cache(maxsize=1)
+def _parse_argv(argv: tuple[str, ...]) -> argparse.Namespace:
+    """Parse an argument vector (cached for repeated calls)."""
+    return _build_parser().parse_args(list(argv))
 
 
-def validate_arguments(args: argparse.Namespace, logger: logging.Logger) -> None:
+def parse_arguments() -> argparse.Namespace:
+    """Parse command line arguments.
+
+    The parser is built on first use, and the parsed namespace is reused
+    as long as sys.argv is unchanged. Treat the result as read-only.
+
+    Returns:
+        Parsed arguments namespace.
+    """
+    return _parse_argv(tuple(sys.argv[1:]))
+
+
+def validate_arguments(args: argparse.Namespace, logger: logging.Logger) -> bool:
     """Validate command line arguments.
 
     Args:
         args: Parsed arguments namespace.
         logger: Logger instance for error messages.
 
-    Exits with code 1 if validation fails.
+    Returns:
+        True if the arguments are valid, False otherwise (errors are logged).
     """
     prepare_and_export = args.prepare_and_export
     screenshot_filter = args.screenshot
@@ -90,30 +121,32 @@ def validate_arguments(args: argparse.Namespace, logger: logging.Logger) -> None
                 "--prepare-and-export requires either (--file and --output) "
                 "or (--directory and --screenshot)"
             )
-            sys.exit(1)
+            return False
 
         if args.file and not args.output:
             logger.error("--file requires --output to be specified")
-            sys.exit(1)
+            return False
 
         if args.output and not args.file:
             logger.error("--output requires --file to be specified")
-            sys.exit(1)
+            return False
 
     # --list-indesign-versions can run standalone
     if getattr(args, "list_indesign_versions", False):
-        return
+        return True
 
     # For non-prepare-and-export modes, require --directory or --config
     if not prepare_and_export and not args.directory and not args.config:
         logger.error("Either --directory or --config is required")
-        sys.exit(1)
+        return False
+
+    return True
 
 
 def resolve_paths(
     args: argparse.Namespace,
     logger: logging.Logger
-) -> tuple[str, str, str, str]:
+) -> tuple[str, str, str, str] | None:
     """Resolve input/output paths from arguments.
 
     Args:
@@ -121,37 +154,35 @@ def resolve_paths(
         logger: Logger instance.
 
     Returns:
-        Tuple of (config_file, input_dir, locales_dir, output_dir).
-
-    Exits with code 1 if paths cannot be resolved.
+        Tuple of (config_file, input_dir, locales_dir, output_dir), or None
+        if paths cannot be resolved (errors are logged).
     """
-    from src.config import ConfigHandler
+    from src.config import get_config_handler
     from src.constants import CONFIG, DIRS
 
     if args.config:
         # --config mode: read directories from JSON
         config_file = args.config
-        if not os.path.isfile(config_file):
-            logger.error(f"Configuration file '{config_file}' does not exist")
-            sys.exit(1)
-
         try:
-            config_handler = ConfigHandler(config_file)
+            config_handler = get_config_handler(config_file)
             dirs = config_handler.get_directories()
+        except (FileNotFoundError, IsADirectoryError):
+            logger.error(f"Configuration file '{config_file}' does not exist")
+            return None
         except Exception as e:
             logger.error(f"Failed to load configuration from '{config_file}': {e}")
-            sys.exit(1)
+            return None
 
-        input_dir = dirs.get("screenshots", "")
-        locales_dir = dirs.get("locales", "")
-        output_dir = dirs.get("output", "")
+        input_dir = dirs.screenshots or ""
+        locales_dir = dirs.locales or ""
+        output_dir = dirs.output or ""
 
         if not input_dir:
             logger.error("Configuration must specify 'directories.screenshots'")
-            sys.exit(1)
+            return None
         if not output_dir:
             logger.error("Configuration must specify 'directories.output'")
-            sys.exit(1)
+            return None
 
         logger.info(f"Starting screenshot cropper with config: {config_file}")
     else:
@@ -159,7 +190,7 @@ def resolve_paths(
         directory = args.directory
         if not os.path.isdir(directory):
             logger.error(f"Directory '{directory}' does not exist")
-            sys.exit(1)
+            return None
 
         config_file = os.path.join(directory, CONFIG.CONFIG_FILE)
         input_dir = os.path.join(directory, DIRS.INPUT, DIRS.SCREENSHOTS)
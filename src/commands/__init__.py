@@ -1,16 +1,43 @@
-"""Command handlers for different operational modes."""
-from src.commands.editor import run_editor
-from src.commands.prepare_export import (
-    run_prepare_export_direct,
-    run_prepare_export_directory,
-)
-from src.commands.process_images import run_image_processing
-from src.commands.process_psd import run_psd_processing
+"""Command handlers for different operational modes.
+
+Handlers are imported on first attribute access (PEP 562), so running one
+command does not load the dependencies of the others.
+"""
+from __future__ import annotations
+
+import importlib
+from typing import Any
+
+_LAZY: dict[str, str] = {
+    "run_editor": "src.commands.editor",
+    "run_prepare_export_direct": "src.commands.prepare_export",
+    "run_prepare_export_directory": "src.commands.prepare_export",
+    "load_config": "src.commands.process_images",
+    "load_locales": "src.commands.process_images",
+    "run_image_processing": "src.commands.process_images",
+    "run_psd_processing": "src.commands.process_psd",
+}
 
 __all__ = [
+    "load_config",
+    "load_locales",
     "run_editor",
     "run_prepare_export_direct",
     "run_prepare_export_directory",
     "run_image_processing",
     "run_psd_processing",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import a command handler on first access."""
+    if name not in _LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_LAZY[name]), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """List module attributes including not yet imported handlers."""
+    return sorted(set(globals()) | set(_LAZY))
@@ -3,78 +3,94 @@ from __future__ import annotations
 
 import logging
 import os
-import sys
+from typing import Callable
 
 from adobe_document_handler import PSDProcessor
 
+from src.cache import DEFAULT_CACHE_DIR, cached_template
 from src.constants import CONFIG, FILE_EXT
-from src.filename_utils import extract_screenshot_number
+from src.filename_utils import build_screenshot_index
+from src.fs_utils import ensure_dir, reset_ensured_dirs
+
+
+def _export_psd_template(design_file: str, output_json: str) -> bool:
+    """Prepare a PSD file and export its template with Photoshop."""
+    return PSDProcessor().prepare_and_export_template(design_file, output_json)
+
+
+def _export_indd_template(design_file: str, output_json: str) -> bool:
+    """Prepare an INDD file and export its template with InDesign."""
+    from adobe_document_handler import InDesignProcessor
+    return InDesignProcessor().prepare_and_export_template(design_file, output_json)
+
+
+# Lowercase file suffix -> (template exporter, file type label)
+_TEMPLATE_EXPORTERS: dict[str, tuple[Callable[[str, str], bool], str]] = {
+    FILE_EXT.PSD: (_export_psd_template, "PSD"),
+    FILE_EXT.INDD: (_export_indd_template, "INDD"),
+}
 
 
 def run_prepare_export_direct(
     design_file: str,
     output_json: str,
-    logger: logging.Logger
-) -> None:
+    logger: logging.Logger,
+    cache_dir: str | None = DEFAULT_CACHE_DIR,
+) -> int:
     """Run prepare-and-export with direct file paths.
 
     Args:
         design_file: Path to the PSD or INDD file.
         output_json: Path for the output JSON file.
         logger: Logger instance.
+        cache_dir: Template cache directory, or None to disable caching.
 
-    Exits with code 0 on success, 1 on failure.
+    Returns:
+        Exit code: 0 on success, 1 on failure.
     """
     logger.info("Running in prepare-and-export mode (direct path)")
+    reset_ensured_dirs()
 
     if not os.path.isfile(design_file):
         logger.error(f"Design file not found: {design_file}")
-        sys.exit(1)
+        return 1
 
     logger.info(f"Design file: {design_file}")
     logger.info(f"Output JSON: {output_json}")
 
-    # Auto-create output directory if it doesn't exist
-    output_dir = os.path.dirname(output_json)
-    if output_dir and not os.path.exists(output_dir):
-        os.makedirs(output_dir)
-        logger.info(f"Created output directory: {output_dir}")
-
-    # Detect file type and use appropriate processor
-    file_lower = design_file.lower()
-
-    if file_lower.endswith(FILE_EXT.INDD):
-        # InDesign file
-        from adobe_document_handler import InDesignProcessor
-        processor = InDesignProcessor()
-        success = processor.prepare_and_export_template(design_file, output_json)
-        file_type = "INDD"
-    elif file_lower.endswith(FILE_EXT.PSD):
-        # Photoshop file
-        processor = PSDProcessor()
-        success = processor.prepare_and_export_template(design_file, output_json)
-        file_type = "PSD"
-    else:
+    # Detect file type and pick the matching exporter
+    suffix = os.path.splitext(design_file)[1].lower()
+    exporter = _TEMPLATE_EXPORTERS.get(suffix)
+    if exporter is None:
         logger.error(
             f"Unsupported file type: {design_file}. "
             f"Supported: {FILE_EXT.PSD}, {FILE_EXT.INDD}"
         )
-        sys.exit(1)
+        return 1
+    export_template, file_type = exporter
+
+    # Auto-create output directory if it doesn't exist
+    output_dir = os.path.dirname(output_json)
+    if output_dir and ensure_dir(output_dir):
+        logger.info(f"Created output directory: {output_dir}")
+
+    success = cached_template(design_file, output_json, export_template, cache_dir)
 
     if success:
         logger.info(f"Successfully prepared {file_type} and exported template")
-        sys.exit(0)
+        return 0
     else:
         logger.error(f"Failed to prepare {file_type} and export template")
-        sys.exit(1)
+        return 1
 
 
 def run_prepare_export_directory(
     input_dir: str,
     output_dir: str,
     screenshot_filter: int,
-    logger: logging.Logger
-) -> None:
+    logger: logging.Logger,
+    cache_dir: str | None = DEFAULT_CACHE_DIR,
+) -> int:
     """Run prepare-and-export with directory-based discovery.
 
     Args:
@@ -82,41 +98,37 @@ def run_prepare_export_directory(
         output_dir: Output directory for the JSON file.
         screenshot_filter: Screenshot number to filter by.
         logger: Logger instance.
+        cache_dir: Template cache directory, or None to disable caching.
 
-    Exits with code 0 on success, 1 on failure.
+    Returns:
+        Exit code: 0 on success, 1 on failure.
     """
     logger.info("Running in prepare-and-export mode (directory-based)")
+    reset_ensured_dirs()
 
     # Find the PSD file matching the screenshot filter
-    psd_file: str | None = None
-    for filename in os.listdir(input_dir):
-        if filename.lower().endswith(FILE_EXT.PSD):
-            screenshot_num = extract_screenshot_number(filename)
-            if screenshot_num == screenshot_filter:
-                psd_file = os.path.join(input_dir, filename)
-                break
+    matching_files = build_screenshot_index(input_dir).get(screenshot_filter)
+    psd_file: str | None = matching_files[0] if matching_files else None
 
     if not psd_file:
         logger.error(f"No PSD file found matching screenshot number: {screenshot_filter}")
-        sys.exit(1)
+        return 1
 
     logger.info(f"Found PSD file: {psd_file}")
 
     # Create output directory
-    if not os.path.exists(output_dir):
-        os.makedirs(output_dir)
+    if ensure_dir(output_dir):
         logger.info(f"Created output directory: {output_dir}")
 
     # Set output path for template.json
     output_json_path = os.path.join(output_dir, CONFIG.TEMPLATE_FILE)
 
-    # Initialize PSD processor and run prepare and export
-    psd_processor = PSDProcessor()
-    success = psd_processor.prepare_and_export_template(psd_file, output_json_path)
+    # Run prepare and export; Photoshop is only started if the template is out of date
+    success = cached_template(psd_file, output_json_path, _export_psd_template, cache_dir)
 
     if success:
         logger.info("Successfully prepared PSD and exported template")
-        sys.exit(0)
+        return 0
     else:
         logger.error("Failed to prepare PSD and export template")
-        sys.exit(1)
+        return 1
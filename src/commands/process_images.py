@@ -3,28 +3,99 @@ from __future__ import annotations
 
 import logging
 import os
+from typing import TYPE_CHECKING
 
-from adobe_document_handler import LocaleHandler
+from src.config import ConfigHandler, get_config_handler
+from src.fs_utils import ensure_dir, reset_ensured_dirs
 
-from src.config import ConfigHandler
-from src.image_processor import ImageProcessor
-from src.models.settings import (
-    BackgroundSettings,
-    CropSettings,
-    ExportSettings,
-    OverlaySettings,
-    TextSettings,
-)
-from src.text_processor import TextProcessor
+if TYPE_CHECKING:
+    from adobe_document_handler import LocaleHandler
+
+    from src.models.settings import (
+        BackgroundSettings,
+        CropSettings,
+        ExportSettings,
+        OverlaySettings,
+        TextSettings,
+    )
+    from src.text_processor import TextProcessor
+
+
+def load_config(config_file: str, logger: logging.Logger) -> ConfigHandler | None:
+    """Load the configuration file once so it can be shared between pipelines.
+
+    Args:
+        config_file: Path to configuration file.
+        logger: Logger instance.
+
+    Returns:
+        Loaded configuration handler, or None if the file is missing or invalid.
+    """
+    logger.info(f"Attempting to load configuration from '{config_file}'")
+    try:
+        config_handler = get_config_handler(config_file)
+        # Parse now so a broken file is reported here, once
+        config_handler.config_data
+        return config_handler
+    except (FileNotFoundError, IsADirectoryError):
+        logger.warning(
+            f"Configuration file '{config_file}' not found. "
+            "Cropping, background addition, and text overlay will be skipped."
+        )
+        return None
+    except Exception as e:
+        logger.error(
+            f"Failed to load or parse configuration from '{config_file}': {e}. "
+            "Cropping, background, and text overlay will be skipped."
+        )
+        return None
+
+
+def load_locales(
+    locales_dir: str,
+    language_filter: str | None,
+    logger: logging.Logger,
+) -> LocaleHandler | None:
+    """Load locale files once so they can be shared between pipelines.
+
+    Args:
+        locales_dir: Directory containing locale files.
+        language_filter: Optional language filter.
+        logger: Logger instance.
+
+    Returns:
+        Loaded locale handler, or None if the directory is missing or invalid.
+    """
+    if not locales_dir or not os.path.isdir(locales_dir):
+        logger.info(
+            f"Locales directory not found: {locales_dir}. "
+            "Images will be processed without localization."
+        )
+        return None
+
+    from src.locales import get_locale_handler
+
+    try:
+        locale_handler = get_locale_handler(locales_dir, language_filter)
+    except Exception as e:
+        logger.error(f"Failed to load locales from '{locales_dir}': {e}")
+        return None
+
+    locales = locale_handler.get_locales()
+    if locales:
+        logger.info(f"Initialized locale handler with locales: {', '.join(locales)}")
+    else:
+        logger.warning("No locales loaded. Check language filter or locales directory.")
+    return locale_handler
 
 
 def run_image_processing(
     config_file: str,
+    config_handler: ConfigHandler | None,
     input_dir: str,
-    locales_dir: str,
+    locale_handler: LocaleHandler | None,
     output_dir: str,
     screenshot_filter: int | None,
-    language_filter: str | None,
     skip_existing: bool,
     logger: logging.Logger,
 ) -> int:
@@ -32,85 +103,66 @@ def run_image_processing(
 
     Args:
         config_file: Path to configuration file.
+        config_handler: Configuration loaded by load_config(), or None.
         input_dir: Input directory containing images.
-        locales_dir: Directory containing locale files.
+        locale_handler: Locales loaded by load_locales(), or None.
         output_dir: Output directory for processed images.
         screenshot_filter: Optional screenshot number filter.
-        language_filter: Optional language filter.
         skip_existing: Whether to skip existing output files.
         logger: Logger instance.
 
     Returns:
         Number of images processed.
     """
+    # Directories may have been removed since an earlier run in this process
+    reset_ensured_dirs()
+
     # Initialize settings
     crop_settings: CropSettings | None = None
     background_settings: BackgroundSettings | None = None
     text_settings: TextSettings | None = None
     overlay_settings: OverlaySettings | None = None
     export_settings: ExportSettings | None = None
-    config_handler: ConfigHandler | None = None
 
     # Create output directory if it doesn't exist
-    if not os.path.exists(output_dir):
-        os.makedirs(output_dir)
+    if ensure_dir(output_dir):
         logger.info(f"Created output directory: {output_dir}")
 
-    if not os.path.isfile(config_file):
-        logger.warning(
-            f"Configuration file '{config_file}' not found. "
-            "Cropping, background addition, and text overlay will be skipped."
-        )
-    else:
-        logger.info(f"Attempting to load configuration from '{config_file}'")
+    if config_handler is not None:
         try:
-            config_handler = ConfigHandler(config_file)
-
-            # Load crop settings
-            current_crop_settings = config_handler.get_crop_settings()
-            if current_crop_settings:
-                crop_settings = current_crop_settings
-                logger.info(f"Loaded crop settings: {crop_settings}")
-            else:
+            # Parse every section in one pass
+            (
+                crop_settings,
+                background_settings,
+                text_settings,
+                overlay_settings,
+                export_settings,
+            ) = config_handler.get_all_settings()
+
+            if not crop_settings:
                 logger.warning(
                     f"No crop settings found in '{config_file}'. Cropping will be skipped."
                 )
 
-            # Load background settings
-            current_background_settings = config_handler.get_background_settings()
-            if current_background_settings:
-                background_settings = current_background_settings
-                logger.info(f"Loaded background settings: {background_settings}")
-            else:
-                logger.info(
-                    f"No background settings found in '{config_file}', or section is missing."
-                )
-
-            # Load text settings
-            current_text_settings = config_handler.get_text_settings()
-            if current_text_settings:
-                text_settings = current_text_settings
-                logger.info(f"Loaded text settings: {text_settings}")
-            else:
-                logger.info(
-                    f"No text settings found in '{config_file}', or section is missing."
-                )
-
-            # Load overlay settings
-            current_overlay_settings = config_handler.get_overlay_settings()
-            if current_overlay_settings:
-                overlay_settings = current_overlay_settings
-                logger.info(f"Loaded overlay settings: {overlay_settings}")
-            else:
-                logger.info(
-                    f"No overlay settings found in '{config_file}', or section is missing."
+            # Lazy %-formatting: nothing is rendered when INFO is disabled
+            if logger.isEnabledFor(logging.INFO):
+                sections = (
+                    ("crop", crop_settings),
+                    ("background", background_settings),
+                    ("text", text_settings),
+                    ("overlay", overlay_settings),
+                    ("export", export_settings),
                 )
-
-            # Load export settings
-            current_export_settings = config_handler.get_export_settings()
-            if current_export_settings:
-                export_settings = current_export_settings
-                logger.info(f"Loaded export settings: {export_settings}")
+                loaded = [f"{name}={value}" for name, value in sections if value]
+                missing = [name for name, value in sections[1:4] if not value]
+                if loaded:
+                    logger.info("Loaded settings: %s", "; ".join(loaded))
+                if missing:
+                    logger.info(
+                        "No %s settings found in '%s', or section is missing.",
+                        ", ".join(missing),
+                        config_file,
+                    )
 
         except Exception as e:
             logger.error(
@@ -123,24 +175,15 @@ def run_image_processing(
             overlay_settings = None
             export_settings = None
 
-    # Initialize locale handler if text settings are available
-    locale_handler: LocaleHandler | None = None
-    if text_settings and locales_dir:
-        if os.path.isdir(locales_dir):
-            locale_handler = LocaleHandler(locales_dir, language_filter)
-            if locale_handler.get_locales():
-                logger.info(
-                    f"Initialized locale handler with locales: "
-                    f"{', '.join(locale_handler.get_locales())}"
-                )
-            else:
-                logger.warning("No locales loaded. Check language filter or locales directory.")
-        else:
-            logger.warning(f"Locales directory not found: {locales_dir}")
+    # Locales are only used for text overlay
+    if not text_settings:
+        locale_handler = None
 
     # Initialize text processor if text settings are available
     text_processor: TextProcessor | None = None
     if text_settings:
+        from src.text_processor import TextProcessor
+
         text_processor = TextProcessor(text_settings)
         logger.info("Initialized text processor")
 
@@ -148,6 +191,8 @@ def run_image_processing(
     processed_count = 0
     if crop_settings:
         logger.info("Proceeding with image processing (cropping, background, text).")
+        from src.image_processor import ImageProcessor
+
         try:
             image_processor = ImageProcessor(
                 input_dir,
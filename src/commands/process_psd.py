@@ -3,20 +3,24 @@ from __future__ import annotations
 
 import logging
 import os
+from concurrent.futures import ThreadPoolExecutor
 
 from adobe_document_handler import LocaleHandler, PSDProcessor
 
-from src.constants import DIRS, FILE_EXT
-from src.filename_utils import extract_screenshot_number
+from src.constants import DIRS, FILE_EXT, PSD_SUFFIXES
+from src.filename_utils import build_screenshot_index
+from src.fs_utils import ensure_dir, reset_ensured_dirs
 from src.models.settings import TextSettings
 
+# Upper bound on threads listing locale output directories concurrently
+MAX_LISTING_WORKERS = 16
+
 
 def run_psd_processing(
     input_dir: str,
     output_dir: str,
-    locales_dir: str,
+    locale_handler: LocaleHandler | None,
     screenshot_filter: int | None,
-    language_filter: str | None,
     skip_existing: bool,
     text_settings: TextSettings | None,
     logger: logging.Logger,
@@ -29,9 +33,8 @@ def run_psd_processing(
     Args:
         input_dir: Input directory containing PSD files.
         output_dir: Output directory for processed files.
-        locales_dir: Directory containing locale files.
+        locale_handler: Locales loaded by load_locales(), or None.
         screenshot_filter: Optional screenshot number filter.
-        language_filter: Optional language filter.
         skip_existing: Whether to skip existing output files.
         text_settings: Optional text settings for font configuration.
         logger: Logger instance.
@@ -40,32 +43,19 @@ def run_psd_processing(
         Number of PSD files processed.
     """
     logger.info("Starting direct PSD processing (ImageProcessor was skipped).")
+    reset_ensured_dirs()
 
-    # Initialize a separate LocaleHandler for PSD processing
+    # Reuse the locale handler shared with image processing; read its
+    # locales once and thread them through instead of re-querying per PSD
+    locales: tuple[str, ...] = tuple(locale_handler.get_locales()) if locale_handler else ()
+    locales_str = ", ".join(locales)
     psd_locale_handler: LocaleHandler | None = None
-    if locales_dir and os.path.isdir(locales_dir):
-        try:
-            psd_locale_handler = LocaleHandler(locales_dir, language_filter)
-            if psd_locale_handler.get_locales():
-                logger.info(
-                    f"Initialized LocaleHandler for PSD processing with locales: "
-                    f"{', '.join(psd_locale_handler.get_locales())}"
-                )
-            else:
-                logger.info(
-                    f"LocaleHandler for PSD initialized, but no locale files found in "
-                    f"'{locales_dir}'. PSDs will be processed to 'default' output."
-                )
-                psd_locale_handler = None
-        except Exception as e:
-            logger.error(
-                f"Failed to initialize LocaleHandler for PSD processing from "
-                f"'{locales_dir}': {e}"
-            )
-            psd_locale_handler = None
+    if locales:
+        psd_locale_handler = locale_handler
+        logger.info(f"Using locales for PSD processing: {locales_str}")
     else:
         logger.info(
-            "Locales directory not configured or not found for PSD processing. "
+            "No locales available for PSD processing. "
             "PSDs will be processed to 'default' output without localization."
         )
 
@@ -85,29 +75,44 @@ def run_psd_processing(
         )
         logger.info("Initialized PSDProcessor for PSD file handling.")
 
+        if screenshot_filter is not None:
+            # Look the filtered screenshot up instead of parsing every filename
+            psd_paths = build_screenshot_index(psd_input_dir).get(screenshot_filter, [])
+        else:
+            # Single scandir pass: DirEntry caches name, path and file type
+            with os.scandir(psd_input_dir) as entries:
+                psd_paths = [
+                    entry.path for entry in entries
+                    if entry.name.endswith(PSD_SUFFIXES) and entry.is_file()
+                ]
+
+        # Resolve locale output directories once, not per PSD; they are
+        # created lazily, only for locales that are not skipped
+        locale_dirs: dict[str, str] = {}
+        if psd_paths and locales:
+            locale_dirs = {loc: os.path.join(output_dir, loc) for loc in locales}
+
+        # Snapshot existing outputs once per locale instead of stat-ing every file
+        existing_by_locale: dict[str, set[str]] = {}
+        if skip_existing:
+            existing_by_locale = _list_existing_outputs(locale_dirs)
+
         psd_files_processed_count = 0
-        for filename in os.listdir(psd_input_dir):
-            if not filename.lower().endswith(FILE_EXT.PSD):
-                continue
-
-            # Check if we should filter by screenshot number
-            if screenshot_filter is not None:
-                screenshot_num = extract_screenshot_number(filename)
-                if screenshot_num != screenshot_filter:
-                    logger.debug(f"Skipping PSD file '{filename}' (filter: {screenshot_filter})")
-                    continue
-
-            psd_file_path = os.path.join(psd_input_dir, filename)
+        for psd_file_path in psd_paths:
+            filename = os.path.basename(psd_file_path)
+            output_png_filename = os.path.splitext(filename)[0] + FILE_EXT.PNG
             logger.info(f"Found PSD file for processing: {psd_file_path}")
 
-            if psd_locale_handler and psd_locale_handler.get_locales():
+            if locale_dirs:
                 psd_files_processed_count += _process_psd_with_locales(
                     psd_processor=psd_processor,
                     psd_file_path=psd_file_path,
                     filename=filename,
-                    output_dir=output_dir,
-                    psd_locale_handler=psd_locale_handler,
+                    output_png_filename=output_png_filename,
+                    locale_dirs=locale_dirs,
+                    locales_str=locales_str,
                     skip_existing=skip_existing,
+                    existing_by_locale=existing_by_locale,
                     logger=logger,
                 )
             else:
@@ -115,6 +120,7 @@ def run_psd_processing(
                     psd_processor=psd_processor,
                     psd_file_path=psd_file_path,
                     filename=filename,
+                    output_png_filename=output_png_filename,
                     output_dir=output_dir,
                     logger=logger,
                 )
@@ -137,23 +143,65 @@ def run_psd_processing(
         return 0
 
 
+def _list_existing_outputs(locale_dirs: dict[str, str]) -> dict[str, set[str]]:
+    """List the files already present in each locale output directory.
+
+    The directories are listed concurrently, which hides per-call latency
+    on network filesystems when there are many locales.
+
+    Args:
+        locale_dirs: Dictionary mapping locale codes to output directories.
+
+    Returns:
+        Dictionary mapping locale codes to the set of file names found.
+    """
+    if not locale_dirs:
+        return {}
+
+    workers = min(MAX_LISTING_WORKERS, len(locale_dirs))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        listings = executor.map(_list_dir_names, locale_dirs.values())
+        return dict(zip(locale_dirs, listings))
+
+
+def _list_dir_names(directory: str) -> set[str]:
+    """Return the names in a directory, or an empty set if it is missing."""
+    try:
+        with os.scandir(directory) as entries:
+            return {entry.name for entry in entries}
+    except FileNotFoundError:
+        return set()
+
+
 def _process_psd_with_locales(
     psd_processor: PSDProcessor,
     psd_file_path: str,
     filename: str,
-    output_dir: str,
-    psd_locale_handler: LocaleHandler,
+    output_png_filename: str,
+    locale_dirs: dict[str, str],
+    locales_str: str,
     skip_existing: bool,
+    existing_by_locale: dict[str, set[str]],
     logger: logging.Logger,
 ) -> int:
     """Process a PSD file with multiple locales.
 
+    Args:
+        psd_processor: Processor used to render the PSD.
+        psd_file_path: Path to the PSD file.
+        filename: Base name of the PSD file, for logging.
+        output_png_filename: Name of the PNG written for each locale.
+        locale_dirs: Dictionary mapping locale codes to output directories.
+        locales_str: Comma-separated locale codes, for logging.
+        skip_existing: Whether to skip locales whose output already exists.
+        existing_by_locale: File names already present per locale.
+        logger: Logger instance.
+
     Returns:
         Number of locale instances processed.
     """
     logger.info(
-        f"Processing PSD '{filename}' for locales: "
-        f"{', '.join(psd_locale_handler.get_locales())}"
+        f"Processing PSD '{filename}' for locales: {locales_str}"
     )
 
     # Build dictionary of output paths for all locales
@@ -161,31 +209,19 @@ def _process_psd_with_locales(
     skipped_count = 0
     processed_count = 0
 
-    for loc in psd_locale_handler.get_locales():
-        locale_specific_output_dir = os.path.join(output_dir, loc)
-        if not os.path.exists(locale_specific_output_dir):
-            os.makedirs(locale_specific_output_dir)
-            logger.info(
-                f"Created PSD output directory for locale '{loc}': "
-                f"{locale_specific_output_dir}"
-            )
-
-        output_png_filename = (
-            os.path.basename(psd_file_path)
-            .replace(".psd", FILE_EXT.PNG)
-            .replace(".PSD", FILE_EXT.PNG)
-        )
-        output_png_path = os.path.join(locale_specific_output_dir, output_png_filename)
-
-        # Check if we should skip this locale
-        if skip_existing and os.path.exists(output_png_path):
+    for loc, locale_dir in locale_dirs.items():
+        # Check if we should skip this locale before touching the filesystem
+        if skip_existing and output_png_filename in existing_by_locale.get(loc, ()):
             logger.info(
                 f"Skipping locale {loc} for PSD '{filename}' - output file already exists"
             )
             skipped_count += 1
             processed_count += 1
-        else:
-            output_paths_by_locale[loc] = output_png_path
+            continue
+
+        if ensure_dir(locale_dir):
+            logger.info(f"Created PSD output directory for locale '{loc}': {locale_dir}")
+        output_paths_by_locale[loc] = os.path.join(locale_dir, output_png_filename)
 
     # Process all locales efficiently in one pass (if any remain)
     if output_paths_by_locale:
@@ -213,6 +249,7 @@ def _process_psd_without_locales(
     psd_processor: PSDProcessor,
     psd_file_path: str,
     filename: str,
+    output_png_filename: str,
     output_dir: str,
     logger: logging.Logger,
 ) -> int:
@@ -227,19 +264,18 @@ def _process_psd_without_locales(
     )
 
     default_output_dir = os.path.join(output_dir, DIRS.DEFAULT)
-    if not os.path.exists(default_output_dir):
-        os.makedirs(default_output_dir)
+    if ensure_dir(default_output_dir):
         logger.info(f"Created default PSD output directory: {default_output_dir}")
 
-    output_png_filename = (
-        os.path.basename(psd_file_path)
-        .replace(".psd", FILE_EXT.PNG)
-        .replace(".PSD", FILE_EXT.PNG)
-    )
     output_png_path = os.path.join(default_output_dir, output_png_filename)
 
     logger.info(f"Processing PSD '{psd_file_path}' (no locale) -> '{output_png_path}'")
-    if psd_processor.process_psd(psd_file_path, output_png_path):
+    # Share the batched code path with the localized branch; the locale handler
+    # is unset here, so the 'default' entry is exported without translation.
+    results = psd_processor.process_psd_for_multiple_locales(
+        psd_file_path, {DIRS.DEFAULT: output_png_path}
+    )
+    if results.get(DIRS.DEFAULT, False):
         return 1
     else:
         logger.error(f"Failed to process PSD '{psd_file_path}' (no locale)")
@@ -3,20 +3,64 @@ Configuration handler for the Screenshot Cropper application.
 """
 from __future__ import annotations
 
+import functools
 import json
 import logging
+import os
+from collections.abc import Mapping
+from types import MappingProxyType
 from typing import Any
 
 from src.models.settings import (
     BackgroundSettings,
     CropSettings,
+    DirectorySettings,
     ExportSettings,
     OverlaySettings,
+    SettingsBundle,
     TextSettings,
 )
 
 logger = logging.getLogger("screenshot_cropper")
 
+# Defaults for keys of the "text.font" section
+TEXT_FONT_DEFAULTS: Mapping[str, Any] = MappingProxyType({
+    "files": {"default": "Arial.ttf"},
+    "names": {},
+    "size": 24,
+    "align": "left",
+    "vertical-align": "top",
+    "x": 0,
+    "y": 0,
+    "width": 100,
+    "height": 100,
+})
+
+# Shared result for configurations without an "export" section
+DEFAULT_EXPORT_SETTINGS = ExportSettings()
+
+_MISSING = object()
+
+
+def _dig(data: Any, path: tuple[str, ...], default: Any = None) -> Any:
+    """Look up a nested configuration value.
+
+    Args:
+        data: Root mapping to search.
+        path: Keys to follow, outermost first.
+        default: Value returned if any key is missing or a level is not a mapping.
+
+    Returns:
+        The value at path, or default.
+    """
+    for key in path:
+        if not isinstance(data, Mapping):
+            return default
+        data = data.get(key, _MISSING)
+        if data is _MISSING:
+            return default
+    return data
+
 
 class ConfigHandler:
     """Handler for configuration file operations."""
@@ -24,11 +68,17 @@ class ConfigHandler:
     def __init__(self, config_file: str) -> None:
         """Initialize the ConfigHandler.
 
+        The file is read on first access to config_data, not here.
+
         Args:
             config_file: Path to the configuration file.
         """
         self.config_file = config_file
-        self.config_data = self._load_config()
+
+    @functools.cached_property
+    def config_data(self) -> dict[str, Any]:
+        """Configuration data, loaded on first access."""
+        return self._load_config()
 
     def _load_config(self) -> dict[str, Any]:
         """Load configuration from file.
@@ -41,43 +91,45 @@ class ConfigHandler:
             json.JSONDecodeError: If the configuration file is not valid JSON.
         """
         try:
-            with open(self.config_file, "r", encoding="utf-8") as f:
-                return json.load(f)
+            # One binary read; json.loads detects the UTF encoding (and BOM) itself
+            with open(self.config_file, "rb") as f:
+                return json.loads(f.read())
         except FileNotFoundError:
-            logger.error(f"Configuration file not found: {self.config_file}")
+            logger.error("Configuration file not found: %s", self.config_file)
             raise
         except json.JSONDecodeError as e:
-            logger.error(f"Invalid JSON in configuration file: {e}")
+            logger.error("Invalid JSON in configuration file: %s", e)
             raise
 
+    def get_all_settings(self) -> SettingsBundle:
+        """Get all settings from configuration.
+
+        Every section is parsed once per handler; later calls, including
+        the individual get_*_settings accessors, reuse the result.
+
+        Returns:
+            Bundle of crop, background, text, overlay and export settings.
+        """
+        return self._settings
+
+    @functools.cached_property
+    def _settings(self) -> SettingsBundle:
+        """Parse every settings section (cached by get_all_settings)."""
+        return SettingsBundle(
+            crop=self._parse_crop_settings(),
+            background=self._parse_background_settings(),
+            text=self._parse_text_settings(),
+            overlay=self._parse_overlay_settings(),
+            export=self._parse_export_settings(),
+        )
+
     def get_crop_settings(self) -> CropSettings | None:
         """Get crop settings from configuration.
 
         Returns:
             Crop settings object, or None if not configured.
         """
-        try:
-            # Check if crop settings are under the "crop" key
-            if "crop" in self.config_data:
-                crop_data = self.config_data["crop"]
-                top = crop_data.get("top", 0)
-                left = crop_data.get("left", 0)
-                right = crop_data.get("right", 0)
-                bottom = crop_data.get("bottom", 0)
-            else:
-                # Fallback to old format for backward compatibility
-                logger.warning(
-                    "Using deprecated JSON format. Please update to new format with 'crop' key."
-                )
-                top = self.config_data.get("top", 0)
-                left = self.config_data.get("left", 0)
-                right = self.config_data.get("right", 0)
-                bottom = self.config_data.get("bottom", 0)
-
-            return CropSettings(top=top, left=left, right=right, bottom=bottom)
-        except KeyError as e:
-            logger.error(f"Missing required crop setting: {e}")
-            return None
+        return self._settings.crop
 
     def get_background_settings(self) -> BackgroundSettings | None:
         """Get background settings from configuration.
@@ -85,38 +137,7 @@ class ConfigHandler:
         Returns:
             Background settings object, or None if not configured.
         """
-        try:
-            # Check if background settings are present
-            if "background" not in self.config_data:
-                return None
-
-            bg_data = self.config_data["background"]
-
-            # Check for required fields
-            if "file" not in bg_data:
-                logger.error("Missing required background setting: file")
-                return None
-
-            # Get position settings
-            position = bg_data.get("position", {})
-            position_x = position.get("x", 0)
-            position_y = position.get("y", 0)
-
-            # Get size settings
-            size = bg_data.get("size", {})
-            width = size.get("width", 100)
-            height = size.get("height", 100)
-
-            return BackgroundSettings(
-                file=bg_data["file"],
-                position_x=position_x,
-                position_y=position_y,
-                width=width,
-                height=height,
-            )
-        except KeyError as e:
-            logger.error(f"Missing required background setting: {e}")
-            return None
+        return self._settings.background
 
     def get_overlay_settings(self) -> OverlaySettings | None:
         """Get overlay settings from configuration.
@@ -124,31 +145,7 @@ class ConfigHandler:
         Returns:
             Overlay settings object, or None if not configured.
         """
-        try:
-            # Check if overlay settings are present at top level
-            if "overlay" not in self.config_data:
-                return None
-
-            overlay_data = self.config_data["overlay"]
-
-            # Check for required fields
-            if "file" not in overlay_data:
-                logger.error("Missing required overlay setting: file")
-                return None
-
-            # Get position settings (default to 0,0)
-            position = overlay_data.get("position", {})
-            position_x = position.get("x", 0)
-            position_y = position.get("y", 0)
-
-            return OverlaySettings(
-                file=overlay_data["file"],
-                position_x=position_x,
-                position_y=position_y,
-            )
-        except KeyError as e:
-            logger.error(f"Missing required overlay setting: {e}")
-            return None
+        return self._settings.overlay
 
     def get_text_settings(self) -> TextSettings | None:
         """Get text settings from configuration.
@@ -156,82 +153,160 @@ class ConfigHandler:
         Returns:
             Text settings object, or None if not configured.
         """
-        try:
-            # Check if text settings are present
-            if "text" not in self.config_data:
-                return None
-
-            text_data = self.config_data["text"]
-
-            # Get font settings
-            font_data = text_data.get("font", {})
-
-            # Get font properties
-            font_files = font_data.get("files", {"default": "Arial.ttf"})
-            if "default" not in font_files:
-                logger.warning("No default font specified, using Arial.ttf")
-                font_files["default"] = "Arial.ttf"
-
-            # Get font names for Photoshop
-            font_names = font_data.get("names", {})
-
-            font_size = font_data.get("size", 24)
-
-            # Get alignment settings
-            align = font_data.get("align", "left")
-            vertical_align = font_data.get("vertical-align", "top")
-
-            # Get position and size
-            x = font_data.get("x", 0)
-            y = font_data.get("y", 0)
-            width = font_data.get("width", 100)
-            height = font_data.get("height", 100)
-
-            # Get color (default is black)
-            color_data = font_data.get("color", {})
-            r = color_data.get("r", 0)
-            g = color_data.get("g", 0)
-            b = color_data.get("b", 0)
-            color = (r, g, b)
-
-            return TextSettings(
-                font_files=font_files,
-                font_size=font_size,
-                align=align,
-                vertical_align=vertical_align,
-                x=x,
-                y=y,
-                width=width,
-                height=height,
-                color=color,
-                font_names=font_names,
+        return self._settings.text
+
+    def get_export_settings(self) -> ExportSettings:
+        """Get export settings from configuration.
+
+        Returns:
+            Export settings object with format, quality, and keep_cropped.
+        """
+        return self._settings.export
+
+    def _parse_crop_settings(self) -> CropSettings | None:
+        """Parse crop settings from configuration.
+
+        Returns:
+            Crop settings object, or None if not configured.
+        """
+        # Check if crop settings are under the "crop" key
+        if "crop" in self.config_data:
+            crop_data = self.config_data["crop"]
+            top = crop_data.get("top", 0)
+            left = crop_data.get("left", 0)
+            right = crop_data.get("right", 0)
+            bottom = crop_data.get("bottom", 0)
+        else:
+            # Fallback to old format for backward compatibility
+            logger.warning(
+                "Using deprecated JSON format. Please update to new format with 'crop' key."
             )
-        except KeyError as e:
-            logger.error(f"Missing required text setting: {e}")
+            top = self.config_data.get("top", 0)
+            left = self.config_data.get("left", 0)
+            right = self.config_data.get("right", 0)
+            bottom = self.config_data.get("bottom", 0)
+
+        return CropSettings(top=top, left=left, right=right, bottom=bottom)
+
+    def _parse_background_settings(self) -> BackgroundSettings | None:
+        """Parse background settings from configuration.
+
+        Returns:
+            Background settings object, or None if not configured.
+        """
+        # Check if background settings are present
+        if "background" not in self.config_data:
+            return None
+
+        bg_data = self.config_data["background"]
+
+        # Check for required fields
+        if "file" not in bg_data:
+            logger.error("Missing required background setting: file")
             return None
 
-    def get_directories(self) -> dict[str, str | None]:
+        return BackgroundSettings(
+            file=bg_data["file"],
+            position_x=_dig(bg_data, ("position", "x"), 0),
+            position_y=_dig(bg_data, ("position", "y"), 0),
+            width=_dig(bg_data, ("size", "width"), 100),
+            height=_dig(bg_data, ("size", "height"), 100),
+        )
+
+    def _parse_overlay_settings(self) -> OverlaySettings | None:
+        """Parse overlay settings from configuration.
+
+        Returns:
+            Overlay settings object, or None if not configured.
+        """
+        # Check if overlay settings are present at top level
+        if "overlay" not in self.config_data:
+            return None
+
+        overlay_data = self.config_data["overlay"]
+
+        # Check for required fields
+        if "file" not in overlay_data:
+            logger.error("Missing required overlay setting: file")
+            return None
+
+        return OverlaySettings(
+            file=overlay_data["file"],
+            position_x=_dig(overlay_data, ("position", "x"), 0),
+            position_y=_dig(overlay_data, ("position", "y"), 0),
+        )
+
+    def _parse_text_settings(self) -> TextSettings | None:
+        """Parse text settings from configuration.
+
+        Returns:
+            Text settings object, or None if not configured.
+        """
+        # Check if text settings are present
+        if "text" not in self.config_data:
+            return None
+
+        text_data = self.config_data["text"]
+
+        # Fill in every missing font key in one merge
+        font_data = {**TEXT_FONT_DEFAULTS, **text_data.get("font", {})}
+
+        font_files = font_data["files"]
+        if isinstance(font_files, dict):
+            # Copy so neither the defaults nor the cached handler's data is modified
+            font_files = dict(font_files)
+        if "default" not in font_files:
+            logger.warning("No default font specified, using Arial.ttf")
+            font_files["default"] = "Arial.ttf"
+
+        # Color channels default to 0 (black)
+        color = (
+            _dig(text_data, ("font", "color", "r"), 0),
+            _dig(text_data, ("font", "color", "g"), 0),
+            _dig(text_data, ("font", "color", "b"), 0),
+        )
+
+        return TextSettings(
+            font_files=font_files,
+            font_size=font_data["size"],
+            align=font_data["align"],
+            vertical_align=font_data["vertical-align"],
+            x=font_data["x"],
+            y=font_data["y"],
+            width=font_data["width"],
+            height=font_data["height"],
+            color=color,
+            # Copied like font_files so no instance shares the default dict
+            font_names=dict(font_data["names"]),
+        )
+
+    def get_directories(self) -> DirectorySettings:
         """Get directory settings from configuration.
 
         Returns:
-            Dictionary with keys 'screenshots', 'locales', 'output'.
+            Directory settings with 'screenshots', 'locales' and 'output'.
             Values are None if not configured.
         """
-        directories = self.config_data.get("directories", {})
-        return {
-            "screenshots": directories.get("screenshots"),
-            "locales": directories.get("locales"),
-            "output": directories.get("output"),
-        }
+        return self._directories
+
+    @functools.cached_property
+    def _directories(self) -> DirectorySettings:
+        """Parse the directories section (cached by get_directories)."""
+        return DirectorySettings(
+            screenshots=_dig(self.config_data, ("directories", "screenshots")),
+            locales=_dig(self.config_data, ("directories", "locales")),
+            output=_dig(self.config_data, ("directories", "output")),
+        )
 
-    def get_export_settings(self) -> ExportSettings:
-        """Get export settings from configuration.
+    def _parse_export_settings(self) -> ExportSettings:
+        """Parse export settings from configuration.
 
         Returns:
-            Export settings object with format, quality, and keep_cropped.
+            Export settings object with format, quality, keep_cropped,
+            lossless, and compress_level.
         """
         if "export" not in self.config_data:
-            return ExportSettings()  # defaults to PNG, quality 90, keep_cropped False
+            return DEFAULT_EXPORT_SETTINGS  # PNG, quality 90, keep_cropped False
 
         export_data = self.config_data["export"]
         return ExportSettings(
@@ -239,4 +314,31 @@ class ConfigHandler:
             quality=export_data.get("quality", 90),
             keep_cropped=export_data.get("keep_cropped", False),
             lossless=export_data.get("lossless", False),
+            compress_level=export_data.get("compress_level", 1),
         )
+
+
+def get_config_handler(config_file: str) -> ConfigHandler:
+    """Get a ConfigHandler for a file, reusing an earlier parse if unchanged.
+
+    Handlers are cached by absolute path, modification time and size, so
+    an edited file is parsed again while repeated loads of the same file
+    within a process share one handler.
+
+    Args:
+        config_file: Path to the configuration file.
+
+    Returns:
+        Configuration handler for the file.
+
+    Raises:
+        FileNotFoundError: If the configuration file does not exist.
+    """
+    stat = os.stat(config_file)
+    return _load_config_handler(os.path.abspath(config_file), stat.st_mtime_ns, stat.st_size)
+
+
+@functools.lru_cache(maxsize=32)
+def _load_config_handler(config_file: str, mtime_ns: int, size: int) -> ConfigHandler:
+    """Parse a configuration file (cached by get_config_handler)."""
+    return ConfigHandler(config_file)
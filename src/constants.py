@@ -1,62 +1,72 @@
 """
 Centralized constants for the Screenshot Cropper application.
 """
-from dataclasses import dataclass
+from itertools import product
+from typing import Final
 
 
-@dataclass(frozen=True)
 class FileExtensions:
     """File extension constants."""
-    PSD: str = ".psd"
-    INDD: str = ".indd"
-    PNG: str = ".png"
-    WEBP: str = ".webp"
-    JSON: str = ".json"
-    JPG: str = ".jpg"
-    JPEG: str = ".jpeg"
-    TTF: str = ".ttf"
+    PSD: Final = ".psd"
+    INDD: Final = ".indd"
+    PNG: Final = ".png"
+    WEBP: Final = ".webp"
+    JSON: Final = ".json"
+    JPG: Final = ".jpg"
+    JPEG: Final = ".jpeg"
+    TTF: Final = ".ttf"
 
 
-@dataclass(frozen=True)
 class ConfigKeys:
     """Configuration file name constants."""
-    CONFIG_FILE: str = "screenshot-cropper.json"
-    TEMPLATE_FILE: str = "template.json"
+    CONFIG_FILE: Final = "screenshot-cropper.json"
+    TEMPLATE_FILE: Final = "template.json"
 
 
-@dataclass(frozen=True)
 class DirectoryNames:
     """Directory name constants."""
-    INPUT: str = "input"
-    OUTPUT: str = "output"
-    SCREENSHOTS: str = "screenshots"
-    LOCALES: str = "locales"
-    DEFAULT: str = "default"
-    CROPPED: str = "cropped"
-    FONTS: str = "fonts"
+    INPUT: Final = "input"
+    OUTPUT: Final = "output"
+    SCREENSHOTS: Final = "screenshots"
+    LOCALES: Final = "locales"
+    DEFAULT: Final = "default"
+    CROPPED: Final = "cropped"
+    FONTS: Final = "fonts"
 
 
-@dataclass(frozen=True)
 class Alignment:
     """Text alignment constants."""
-    LEFT: str = "left"
-    CENTER: str = "center"
-    RIGHT: str = "right"
-    TOP: str = "top"
-    MIDDLE: str = "middle"
-    BOTTOM: str = "bottom"
+    LEFT: Final = "left"
+    CENTER: Final = "center"
+    RIGHT: Final = "right"
+    TOP: Final = "top"
+    MIDDLE: Final = "middle"
+    BOTTOM: Final = "bottom"
 
 
-@dataclass(frozen=True)
 class ExportFormats:
     """Export format constants."""
-    PNG: str = "png"
-    WEBP: str = "webp"
+    PNG: Final = "png"
+    WEBP: Final = "webp"
 
 
-# Singleton instances for easy access
-FILE_EXT = FileExtensions()
-CONFIG = ConfigKeys()
-DIRS = DirectoryNames()
-ALIGN = Alignment()
-FORMATS = ExportFormats()
+# Namespace aliases for easy access (classes are never instantiated)
+FILE_EXT = FileExtensions
+CONFIG = ConfigKeys
+DIRS = DirectoryNames
+ALIGN = Alignment
+FORMATS = ExportFormats
+
+
+def _case_variants(suffix: str) -> tuple[str, ...]:
+    """Return every letter-case spelling of a suffix.
+
+    str.endswith() accepts the result directly, which matches filenames
+    case-insensitively without lowercasing each one.
+    """
+    return tuple(
+        "".join(chars) for chars in product(*(dict.fromkeys((c.lower(), c.upper())) for c in suffix))
+    )
+
+
+PSD_SUFFIXES: tuple[str, ...] = _case_variants(FILE_EXT.PSD)
@@ -2,12 +2,47 @@
 Visual Editor for Screenshot Cropper configuration.
 Allows interactive positioning and scaling of background, screenshot, and overlay layers.
 """
+from __future__ import annotations
+
 import json
+import math
 import os
+import threading
 import tkinter as tk
+from dataclasses import dataclass
 from tkinter import ttk, messagebox
 from PIL import Image, ImageTk
 
+# Screenshot file extensions picked up by the editor
+SCREENSHOT_EXTENSIONS = ('.png', '.jpg', '.jpeg')
+
+# Delay after the last spinbox edit before its handler runs
+DEBOUNCE_DELAY_MS = 80
+
+# Window in which repeated arrow-key nudges are merged into one move
+NUDGE_BATCH_MS = 16
+
+# Interval for checking whether the background decode has finished
+DECODE_POLL_MS = 50
+
+# Delay after the last scaling change before re-rendering with LANCZOS
+REFINE_DELAY_MS = 200
+
+
+@dataclass(slots=True)
+class Layer:
+    """An image layer shown in the editor."""
+
+    position: tuple[int, int]
+    size: tuple[int, int]
+    original_size: tuple[int, int]
+    # Opened file, kept until the decode thread converts it to rgba
+    source: Image.Image | None = None
+    rgba: Image.Image | None = None
+    # File the layer was loaded from, for re-decoding a drafted JPEG at full
+    # resolution; cleared once that has been started
+    path: str | None = None
+
 
 class EditorWindow:
     """Main editor window for visual configuration."""
@@ -24,10 +59,13 @@ class EditorWindow:
         self.config_path = config_path
         self.input_dir = os.path.join(base_dir, "input")
 
+        # Resolved _find_file results: {filename: path or None}
+        self._path_cache = {}
+
         # Load config
         self.config = self._load_config()
 
-        # Layer data: {name: {image, position, size, original_size}}
+        # Layer data: {name: Layer}
         self.layers = {}
         self.layer_vars = {}
         self.layer_frames = {}
@@ -48,6 +86,53 @@ class EditorWindow:
         self.zoom = 0.5  # Start at 50% zoom for large images
         self.pan_offset = (0, 0)
 
+        # True while a render is scheduled but has not run yet
+        self._render_pending = False
+
+        # Pending debounced spinbox handlers: {key: after id}
+        self._debounce_ids = {}
+
+        # True while controls are updated from layer data; their traces are
+        # ignored then, since the layers already hold the new values
+        self._syncing = False
+
+        # Arrow-key nudges accumulated until the next flush
+        self._pending_nudge = [0, 0]
+        self._nudge_job = None
+
+        # Render caches: background composite (never changes after load) and
+        # the cropped/resized screenshot with the (crop, size, filter) key it
+        # was built for
+        self._base_composite = None
+        self._cropped_screenshot = None
+        self._last_screenshot_key = None
+
+        # True while the user drags a layer; layers are then scaled with
+        # BILINEAR instead of the current resampling filter
+        self._interactive = False
+
+        # Layers scaled to the display zoom: {(name, filter): (zoom, source, scaled)}
+        self._zoom_cache = {}
+
+        # Resampling filter for the screenshot and display resizes; BILINEAR
+        # while the screenshot is being scaled, LANCZOS once it settles
+        self._resample = Image.Resampling.LANCZOS
+        self._refine_job = None
+
+        # Worker thread decoding the layer images, None once finished
+        self._decode_thread = None
+        self._decoded = {}
+        self._loading_text_id = None
+
+        # Display-sized composite buffer and the PhotoImage showing it, both
+        # reused across renders while the display size stays the same
+        self._composite_buf = None
+        self.photo = None
+
+        # Persistent canvas items, updated in place on each render
+        self._canvas_image_id = None
+        self._canvas_rect_id = None
+
         # Setup window
         self.root = tk.Tk()
         self.root.title("Screenshot Cropper Editor")
@@ -64,18 +149,21 @@ class EditorWindow:
         self.root.bind('<Shift-Up>', lambda e: self._nudge(0, -10))
         self.root.bind('<Shift-Down>', lambda e: self._nudge(0, 10))
 
-        # Load images first to know which layers exist
+        # Load images first to know which layers exist, then decode their
+        # pixels in the background while the UI is built
         self._load_images()
+        self._start_decoding()
         self._setup_ui()
         self._sync_controls_from_layers()  # Sync UI with loaded values
         self._update_canvas()
 
     def _load_config(self):
         """Load configuration from JSON file."""
-        if os.path.exists(self.config_path):
-            with open(self.config_path, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        return {}
+        try:
+            with open(self.config_path, 'rb') as f:
+                return json.loads(f.read())
+        except FileNotFoundError:
+            return {}
 
     def _save_config(self):
         """Save current layer positions/sizes to config JSON."""
@@ -99,10 +187,10 @@ class EditorWindow:
                 self.config['background']['size'] = {}
 
             # Screenshot position is where cropped image is placed on background
-            self.config['background']['position']['x'] = layer['position'][0]
-            self.config['background']['position']['y'] = layer['position'][1]
-            self.config['background']['size']['width'] = layer['size'][0]
-            self.config['background']['size']['height'] = layer['size'][1]
+            self.config['background']['position']['x'] = layer.position[0]
+            self.config['background']['position']['y'] = layer.position[1]
+            self.config['background']['size']['width'] = layer.size[0]
+            self.config['background']['size']['height'] = layer.size[1]
 
         # Update overlay settings
         if 'overlay' in self.layers:
@@ -112,12 +200,15 @@ class EditorWindow:
             if 'position' not in self.config['overlay']:
                 self.config['overlay']['position'] = {}
 
-            self.config['overlay']['position']['x'] = layer['position'][0]
-            self.config['overlay']['position']['y'] = layer['position'][1]
+            self.config['overlay']['position']['x'] = layer.position[0]
+            self.config['overlay']['position']['y'] = layer.position[1]
 
-        # Write config
-        with open(self.config_path, 'w', encoding='utf-8') as f:
+        # Write config to a temporary file and swap it in, so a crash while
+        # writing never leaves a truncated config behind
+        tmp_path = self.config_path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
             json.dump(self.config, f, indent=2, ensure_ascii=False)
+        os.replace(tmp_path, self.config_path)
 
         self._update_status("Configuration saved!")
         messagebox.showinfo("Saved", f"Configuration saved to:\n{self.config_path}")
@@ -158,14 +249,14 @@ class EditorWindow:
         top_var = tk.IntVar(value=self.crop_settings['top'])
         top_spin = ttk.Spinbox(tb_frame, from_=0, to=9999, width=6, textvariable=top_var)
         top_spin.pack(side=tk.LEFT, padx=2)
-        top_var.trace_add('write', lambda *args: self._on_crop_change())
+        top_var.trace_add('write', lambda *args: self._debounce('crop', self._on_crop_change))
         self.crop_vars['top'] = top_var
 
         ttk.Label(tb_frame, text="Bottom:").pack(side=tk.LEFT, padx=(10, 0))
         bottom_var = tk.IntVar(value=self.crop_settings['bottom'])
         bottom_spin = ttk.Spinbox(tb_frame, from_=0, to=9999, width=6, textvariable=bottom_var)
         bottom_spin.pack(side=tk.LEFT, padx=2)
-        bottom_var.trace_add('write', lambda *args: self._on_crop_change())
+        bottom_var.trace_add('write', lambda *args: self._debounce('crop', self._on_crop_change))
         self.crop_vars['bottom'] = bottom_var
 
         # Left/Right row
@@ -175,14 +266,14 @@ class EditorWindow:
         left_var = tk.IntVar(value=self.crop_settings['left'])
         left_spin = ttk.Spinbox(lr_frame, from_=0, to=9999, width=6, textvariable=left_var)
         left_spin.pack(side=tk.LEFT, padx=2)
-        left_var.trace_add('write', lambda *args: self._on_crop_change())
+        left_var.trace_add('write', lambda *args: self._debounce('crop', self._on_crop_change))
         self.crop_vars['left'] = left_var
 
         ttk.Label(lr_frame, text="Right:").pack(side=tk.LEFT, padx=(10, 0))
         right_var = tk.IntVar(value=self.crop_settings['right'])
         right_spin = ttk.Spinbox(lr_frame, from_=0, to=9999, width=6, textvariable=right_var)
         right_spin.pack(side=tk.LEFT, padx=2)
-        right_var.trace_add('write', lambda *args: self._on_crop_change())
+        right_var.trace_add('write', lambda *args: self._debounce('crop', self._on_crop_change))
         self.crop_vars['right'] = right_var
 
         # Zoom control
@@ -203,9 +294,9 @@ class EditorWindow:
                 self._create_layer_controls(controls_frame, layer_name)
             else:
                 # Show placeholder for missing layer
-                frame = ttk.LabelFrame(controls_frame, text=f"{layer_name.capitalize()} (not found)")
+                frame = ttk.LabelFrame(controls_frame)
                 frame.pack(fill=tk.X, pady=5)
-                ttk.Label(frame, text="Image file not found", foreground='gray').pack(pady=5)
+                self._show_missing_layer(frame, layer_name)
 
         # Save button
         save_frame = ttk.Frame(controls_frame)
@@ -217,6 +308,13 @@ class EditorWindow:
         status_bar = ttk.Label(self.root, textvariable=self.status_var, relief=tk.SUNKEN, anchor=tk.W)
         status_bar.pack(side=tk.BOTTOM, fill=tk.X)
 
+    def _show_missing_layer(self, frame, layer_name):
+        """Turn a layer frame into the placeholder for a missing image."""
+        for child in frame.winfo_children():
+            child.destroy()
+        frame.configure(text=f"{layer_name.capitalize()} (not found)", style='TLabelframe')
+        ttk.Label(frame, text="Image file not found", foreground='gray').pack(pady=5)
+
     def _create_layer_controls(self, parent, layer_name):
         """Create control panel for a layer."""
         frame = ttk.LabelFrame(parent, text=layer_name.capitalize())
@@ -242,13 +340,15 @@ class EditorWindow:
         x_var = tk.IntVar(value=0)
         x_spin = ttk.Spinbox(pos_frame, from_=-9999, to=9999, width=6, textvariable=x_var)
         x_spin.pack(side=tk.LEFT, padx=2)
-        x_var.trace_add('write', lambda *args, ln=layer_name, v=x_var: self._on_position_change(ln, 'x', v))
+        x_var.trace_add('write', lambda *args, ln=layer_name, v=x_var:
+            self._debounce((ln, 'x'), self._on_position_change, ln, 'x', v))
 
         ttk.Label(pos_frame, text="Y:").pack(side=tk.LEFT, padx=(10, 0))
         y_var = tk.IntVar(value=0)
         y_spin = ttk.Spinbox(pos_frame, from_=-9999, to=9999, width=6, textvariable=y_var)
         y_spin.pack(side=tk.LEFT, padx=2)
-        y_var.trace_add('write', lambda *args, ln=layer_name, v=y_var: self._on_position_change(ln, 'y', v))
+        y_var.trace_add('write', lambda *args, ln=layer_name, v=y_var:
+            self._debounce((ln, 'y'), self._on_position_change, ln, 'y', v))
 
         # Store references
         self.layer_vars[layer_name] = {'x': x_var, 'y': y_var}
@@ -262,7 +362,7 @@ class EditorWindow:
             w_var = tk.IntVar(value=0)
             w_spin = ttk.Spinbox(size_frame, from_=1, to=9999, width=6, textvariable=w_var)
             w_spin.pack(side=tk.LEFT, padx=2)
-            w_var.trace_add('write', lambda *args, v=w_var: self._on_width_change(v))
+            w_var.trace_add('write', lambda *args, v=w_var: self._debounce('width', self._on_width_change, v))
             self.layer_vars[layer_name]['width'] = w_var
 
             ttk.Label(size_frame, text="Height:").pack(side=tk.LEFT, padx=(10, 0))
@@ -272,20 +372,25 @@ class EditorWindow:
             self.layer_vars[layer_name]['height'] = h_var
 
     def _find_file(self, filename):
-        """Find file in multiple locations (like original compositor)."""
-        # Check if it's an absolute path
-        if os.path.isabs(filename) and os.path.exists(filename):
-            return filename
+        """Find file in multiple locations (like original compositor).
 
-        # Check in input directory
-        path = os.path.join(self.input_dir, filename)
-        if os.path.exists(path):
-            return path
+        Results are cached, so each name is only looked up on disk once.
+        """
+        if filename not in self._path_cache:
+            self._path_cache[filename] = self._search_file(filename)
+        return self._path_cache[filename]
+
+    def _search_file(self, filename):
+        """Search the absolute path, input directory and base directory."""
+        # Check if it's an absolute path
+        if os.path.isabs(filename):
+            return filename if os.path.exists(filename) else None
 
-        # Check in base directory
-        path = os.path.join(self.base_dir, filename)
-        if os.path.exists(path):
-            return path
+        # Check in input directory, then in base directory
+        for directory in (self.input_dir, self.base_dir):
+            path = os.path.join(directory, filename)
+            if os.path.exists(path):
+                return path
 
         return None
 
@@ -299,12 +404,12 @@ class EditorWindow:
         try:
             if bg_path:
                 img = Image.open(bg_path)
-                self.layers['background'] = {
-                    'image': img,
-                    'position': (0, 0),  # Background is the base, always at 0,0
-                    'size': img.size,
-                    'original_size': img.size
-                }
+                self.layers['background'] = Layer(
+                    position=(0, 0),  # Background is the base, always at 0,0
+                    size=img.size,
+                    original_size=img.size,
+                    source=img
+                )
                 print(f"Loaded background: {bg_path}")
             else:
                 print(f"Warning: Background file not found: {bg_file}")
@@ -334,11 +439,14 @@ class EditorWindow:
                 break
             try:
                 if os.path.isdir(screenshots_dir):
-                    for fname in sorted(os.listdir(screenshots_dir)):
+                    with os.scandir(screenshots_dir) as entries:
+                        fnames = sorted(entry.name for entry in entries if entry.is_file())
+                    for fname in fnames:
+                        lower = fname.lower()
                         # Skip background and overlay files
-                        if fname.lower() in exclude_files:
+                        if lower in exclude_files:
                             continue
-                        if fname.lower().endswith(('.png', '.jpg', '.jpeg')):
+                        if lower.endswith(SCREENSHOT_EXTENSIONS):
                             screenshot_path = os.path.join(screenshots_dir, fname)
                             img = Image.open(screenshot_path)
 
@@ -348,12 +456,25 @@ class EditorWindow:
                             width = bg_config.get('size', {}).get('width', img.width)
                             height = bg_config.get('size', {}).get('height', img.height)
 
-                            self.layers['screenshot'] = {
-                                'image': img,
-                                'position': (pos_x, pos_y),
-                                'size': (width, height),
-                                'original_size': img.size
-                            }
+                            # Let JPEG decode at a reduced scale, keeping 2x the
+                            # target size for the cropped region as zoom headroom
+                            # (no-op for PNG). original_size stays the full size
+                            # so crop values keep referring to original pixels.
+                            original_size = img.size
+                            cropped_w, cropped_h = self._get_cropped_size(original_size)
+                            if width > 0 and height > 0:
+                                img.draft('RGB', (
+                                    math.ceil(img.width * 2 * width / cropped_w),
+                                    math.ceil(img.height * 2 * height / cropped_h)
+                                ))
+
+                            self.layers['screenshot'] = Layer(
+                                position=(pos_x, pos_y),
+                                size=(width, height),
+                                original_size=original_size,
+                                source=img,
+                                path=screenshot_path
+                            )
                             print(f"Loaded screenshot: {screenshot_path}")
                             screenshot_loaded = True
                             break
@@ -374,109 +495,290 @@ class EditorWindow:
                     img = Image.open(overlay_path)
                     pos_x = overlay_config.get('position', {}).get('x', 0)
                     pos_y = overlay_config.get('position', {}).get('y', 0)
-                    self.layers['overlay'] = {
-                        'image': img,
-                        'position': (pos_x, pos_y),
-                        'size': img.size,
-                        'original_size': img.size
-                    }
+                    self.layers['overlay'] = Layer(
+                        position=(pos_x, pos_y),
+                        size=img.size,
+                        original_size=img.size,
+                        source=img
+                    )
                     print(f"Loaded overlay: {overlay_path}")
                 else:
                     print(f"Warning: Overlay file not found: {overlay_file}")
             except Exception as e:
                 print(f"Warning: Could not load overlay image: {e}")
 
+    def _start_decoding(self, sources=None):
+        """Decode the opened layer images to RGBA on a worker thread.
+
+        Image.open only reads the headers, so sizes are known right away;
+        the canvas shows a placeholder until _poll_decoding sees the worker
+        finish.
+
+        Args:
+            sources: Opened images by layer name, to replace the decoded image
+                of layers that already have one. Defaults to every layer's
+                source.
+        """
+        if sources is None:
+            sources = {}
+            for name, layer in self.layers.items():
+                sources[name] = layer.source
+                layer.source = None
+        self._decode_thread = threading.Thread(target=self._decode_layers, args=(sources,), daemon=True)
+        self._decode_thread.start()
+        self.root.after(DECODE_POLL_MS, self._poll_decoding)
+
+    def _decode_layers(self, sources):
+        """Decode each image to RGBA and close its file (worker thread)."""
+        for layer_name, img in sources.items():
+            try:
+                with img:
+                    self._decoded[layer_name] = img.convert('RGBA')
+            except Exception as e:
+                print(f"Warning: Could not decode {layer_name} image: {e}")
+
+    def _poll_decoding(self):
+        """Hand decoded images to the layers once the worker has finished."""
+        if self._decode_thread.is_alive():
+            self.root.after(DECODE_POLL_MS, self._poll_decoding)
+            return
+
+        self._decode_thread = None
+        for layer_name in list(self.layers):
+            rgba = self._decoded.pop(layer_name, None)
+            if rgba is None:
+                if self.layers[layer_name].rgba is not None:
+                    # Not re-decoded, or that failed: keep the current image
+                    continue
+                # Could not be decoded: drop the layer and its controls
+                del self.layers[layer_name]
+                self.layer_vars.pop(layer_name, None)
+                frame = self.layer_frames.pop(layer_name, None)
+                if frame is not None:
+                    self._show_missing_layer(frame, layer_name)
+                if self.selected_layer == layer_name:
+                    self.selected_layer = None
+            else:
+                self.layers[layer_name].rgba = rgba
+        # Rebuild the screenshot from a full resolution re-decode
+        self._last_screenshot_key = None
+
+        if self._loading_text_id is not None:
+            self.canvas.delete(self._loading_text_id)
+            self._loading_text_id = None
+        self._request_render()
+
     def _sync_controls_from_layers(self):
         """Sync control values from layer data."""
-        for layer_name, layer_data in self.layers.items():
-            if layer_name in self.layer_vars:
-                vars_dict = self.layer_vars[layer_name]
-                # Background has no position controls
-                if 'x' in vars_dict:
-                    vars_dict['x'].set(layer_data['position'][0])
-                if 'y' in vars_dict:
-                    vars_dict['y'].set(layer_data['position'][1])
-                if 'width' in vars_dict:
-                    vars_dict['width'].set(layer_data['size'][0])
-                if 'height' in vars_dict:
-                    vars_dict['height'].set(layer_data['size'][1])
+        self._syncing = True
+        try:
+            for layer_name, layer_data in self.layers.items():
+                if layer_name in self.layer_vars:
+                    vars_dict = self.layer_vars[layer_name]
+                    # Background has no position controls
+                    if 'x' in vars_dict:
+                        vars_dict['x'].set(layer_data.position[0])
+                    if 'y' in vars_dict:
+                        vars_dict['y'].set(layer_data.position[1])
+                    if 'width' in vars_dict:
+                        vars_dict['width'].set(layer_data.size[0])
+                    if 'height' in vars_dict:
+                        vars_dict['height'].set(layer_data.size[1])
+        finally:
+            self._syncing = False
 
     def _update_canvas(self):
         """Render the composite image on canvas."""
-        self.canvas.delete('all')
-
         if not self.layers:
             return
 
-        # Determine canvas size based on background or largest layer
-        if 'background' in self.layers:
-            base_size = self.layers['background']['size']
-        else:
-            base_size = (1000, 1000)
+        # Show a placeholder until the layer images are decoded
+        if any(layer.rgba is None for layer in self.layers.values()):
+            if self._loading_text_id is None:
+                self._loading_text_id = self.canvas.create_text(
+                    10, 10, anchor=tk.NW, text="Loading images...", fill='#CCCCCC'
+                )
+            return
 
-        # Create composite image
-        composite = Image.new('RGBA', base_size, (50, 50, 50, 255))
+        # Composite directly at display size, starting from the cached
+        # background scaled to the current zoom. The buffer is refilled in
+        # place and only reallocated when the display size changes.
+        base = self._get_zoomed_image('background', self._get_base_composite())
+        if self._composite_buf is None or self._composite_buf.size != base.size:
+            self._composite_buf = base.copy()
+        else:
+            self._composite_buf.paste(base, (0, 0))
+        composite = self._composite_buf
 
-        # Render layers in order: background, screenshot, overlay
-        for layer_name in ['background', 'screenshot', 'overlay']:
+        # Render remaining layers in order: screenshot, overlay
+        for layer_name in ['screenshot', 'overlay']:
             if layer_name not in self.layers:
                 continue
 
             layer = self.layers[layer_name]
-            img = layer['image'].copy()
-
-            # Apply crop and resize to screenshot
             if layer_name == 'screenshot':
-                # Apply crop first
-                orig_w, orig_h = layer['original_size']
-                crop_left = self.crop_settings['left']
-                crop_top = self.crop_settings['top']
-                crop_right = orig_w - self.crop_settings['right']
-                crop_bottom = orig_h - self.crop_settings['bottom']
-
-                # Validate crop box
-                if crop_left < crop_right and crop_top < crop_bottom:
-                    img = img.crop((crop_left, crop_top, crop_right, crop_bottom))
-
-                # Then resize to target size
-                if layer['size'][0] > 0 and layer['size'][1] > 0:
-                    img = img.resize(layer['size'], Image.Resampling.LANCZOS)
-
-            # Convert to RGBA if needed
-            if img.mode != 'RGBA':
-                img = img.convert('RGBA')
-
-            # Paste at position
-            pos = layer['position']
-            try:
-                composite.paste(img, pos, img if img.mode == 'RGBA' else None)
-            except ValueError:
-                # Handle case where paste position is partially outside
-                composite.paste(img, pos)
+                img = self._get_screenshot_image()
+            else:
+                img = layer.rgba
 
-        # Apply zoom
-        display_size = (int(base_size[0] * self.zoom), int(base_size[1] * self.zoom))
-        display_img = composite.resize(display_size, Image.Resampling.LANCZOS)
+            # Composite at zoomed position ("over" operator, clipped to the canvas)
+            img = self._get_zoomed_image(layer_name, img)
+            x, y = layer.position
+            composite.alpha_composite(img, (int(x * self.zoom), int(y * self.zoom)))
 
-        # Convert to PhotoImage
-        self.photo = ImageTk.PhotoImage(display_img)
-        self.canvas.create_image(0, 0, anchor=tk.NW, image=self.photo)
+        # Update the PhotoImage in place while its size matches, otherwise
+        # create a new one for the canvas image item
+        if self.photo is not None and (self.photo.width(), self.photo.height()) == composite.size:
+            self.photo.paste(composite)
+        else:
+            self.photo = ImageTk.PhotoImage(composite)
+            if self._canvas_image_id is None:
+                self._canvas_image_id = self.canvas.create_image(0, 0, anchor=tk.NW, image=self.photo)
+                self._canvas_rect_id = self.canvas.create_rectangle(
+                    0, 0, 0, 0, outline='#00FF00', width=2, dash=(5, 5), state=tk.HIDDEN
+                )
+            else:
+                self.canvas.itemconfig(self._canvas_image_id, image=self.photo)
 
         # Draw selection indicator
         if self.selected_layer and self.selected_layer in self.layers:
             layer = self.layers[self.selected_layer]
-            x, y = layer['position']
-            w, h = layer['size']
+            x, y = layer.position
+            w, h = layer.size
 
             # Scale to zoom
             x1, y1 = int(x * self.zoom), int(y * self.zoom)
             x2, y2 = int((x + w) * self.zoom), int((y + h) * self.zoom)
 
-            self.canvas.create_rectangle(x1, y1, x2, y2, outline='#00FF00', width=2, dash=(5, 5))
+            self.canvas.coords(self._canvas_rect_id, x1, y1, x2, y2)
+            self.canvas.itemconfig(self._canvas_rect_id, state=tk.NORMAL)
+        else:
+            self.canvas.itemconfig(self._canvas_rect_id, state=tk.HIDDEN)
 
         # Update zoom display
         self.zoom_var.set(f"{int(self.zoom * 100)}%")
 
+    def _get_base_composite(self):
+        """Get the canvas-sized composite holding only the background layer.
+
+        Built once; the background is fixed at 0,0 and never edited.
+        """
+        if self._base_composite is None:
+            # Determine canvas size based on background
+            if 'background' in self.layers:
+                base_size = self.layers['background'].size
+            else:
+                base_size = (1000, 1000)
+
+            composite = Image.new('RGBA', base_size, (50, 50, 50, 255))
+            if 'background' in self.layers:
+                img = self.layers['background'].rgba
+                composite.alpha_composite(img)
+            self._base_composite = composite
+        return self._base_composite
+
+    def _get_screenshot_image(self):
+        """Get the cropped and resized RGBA screenshot.
+
+        Rebuilt only when crop, size or resampling filter changed since the
+        last render; pure moves and zoom changes reuse the cached image.
+        """
+        layer = self.layers['screenshot']
+        key = (tuple(self.crop_settings.values()), layer.size, self._resample)
+        if key != self._last_screenshot_key:
+            img = layer.rgba
+
+            # Apply crop first
+            orig_w, orig_h = layer.original_size
+            crop_left = self.crop_settings['left']
+            crop_top = self.crop_settings['top']
+            crop_right = orig_w - self.crop_settings['right']
+            crop_bottom = orig_h - self.crop_settings['bottom']
+
+            # Validate crop box
+            if crop_left < crop_right and crop_top < crop_bottom:
+                box = (crop_left, crop_top, crop_right, crop_bottom)
+                # Map to decoded pixels if the JPEG was drafted smaller
+                if img.width != orig_w:
+                    scale = img.width / orig_w
+                    scaled_box = tuple(round(v * scale) for v in box)
+                    if (scaled_box[2] - scaled_box[0] >= layer.size[0]
+                            and scaled_box[3] - scaled_box[1] >= layer.size[1]):
+                        box = scaled_box
+                    else:
+                        # Crop margins or width grew since loading, so the
+                        # drafted image is upscaled until the full resolution
+                        # decode arrives
+                        self._start_full_decode(layer)
+                        box = scaled_box
+                img = img.crop(box)
+
+            # Then resize to target size
+            if layer.size[0] > 0 and layer.size[1] > 0:
+                img = img.resize(layer.size, self._resample)
+
+            self._cropped_screenshot = img
+            self._last_screenshot_key = key
+        return self._cropped_screenshot
+
+    def _start_full_decode(self, layer):
+        """Re-decode the drafted screenshot at full resolution, once."""
+        if layer.path is None or self._decode_thread is not None:
+            return
+        path, layer.path = layer.path, None
+        try:
+            source = Image.open(path)
+        except Exception as e:
+            print(f"Warning: Could not reopen screenshot image: {e}")
+            return
+        self._start_decoding({'screenshot': source})
+
+    def _get_zoomed_image(self, layer_name, img):
+        """Get a layer image scaled to the current zoom.
+
+        Cached per layer and filter until the zoom or source image changes,
+        so moving layers only costs pasting display-sized images and the
+        full-resolution composite is never resized.
+        """
+        resample = Image.Resampling.BILINEAR if self._interactive else self._resample
+        zoom_key = round(self.zoom, 2)
+        cached = self._zoom_cache.get((layer_name, resample))
+        if cached and cached[0] == zoom_key and cached[1] is img:
+            return cached[2]
+
+        size = (max(1, int(img.width * self.zoom)), max(1, int(img.height * self.zoom)))
+        scaled = img.resize(size, resample)
+        self._zoom_cache[(layer_name, resample)] = (zoom_key, img, scaled)
+        return scaled
+
+    def _begin_fast_scaling(self):
+        """Render with BILINEAR until scaling pauses, then refine with LANCZOS."""
+        self._resample = Image.Resampling.BILINEAR
+        if self._refine_job is not None:
+            self.root.after_cancel(self._refine_job)
+        self._refine_job = self.root.after(REFINE_DELAY_MS, self._refine_render)
+
+    def _refine_render(self):
+        """Re-render the screenshot and display at full quality."""
+        self._refine_job = None
+        self._resample = Image.Resampling.LANCZOS
+        self._request_render()
+
+    def _request_render(self):
+        """Schedule a canvas render for the next idle tick.
+
+        Several requests before the render runs (fast drags, key repeats,
+        spinbox traces) are coalesced into a single render.
+        """
+        if not self._render_pending:
+            self._render_pending = True
+            self.root.after_idle(self._flush_render)
+
+    def _flush_render(self):
+        """Run the scheduled canvas render."""
+        self._render_pending = False
+        self._update_canvas()
+
     def _select_layer(self, layer_name):
         """Select a layer for editing."""
         # Background cannot be selected (it's fixed at 0,0)
@@ -486,7 +788,7 @@ class EditorWindow:
         if layer_name in self.layers:
             self.selected_layer = layer_name
             self._update_status(f"Selected: {layer_name.capitalize()}")
-            self._update_canvas()
+            self._request_render()
 
             # Update frame appearance
             for name, frame in self.layer_frames.items():
@@ -507,17 +809,18 @@ class EditorWindow:
                 continue
 
             layer = self.layers[layer_name]
-            x, y = layer['position']
-            w, h = layer['size']
+            x, y = layer.position
+            w, h = layer.size
 
             if x <= img_x <= x + w and y <= img_y <= y + h:
                 self._select_layer(layer_name)
                 self.drag_start = (event.x, event.y, x, y)
+                self._interactive = True
                 return
 
         # Click on empty space - deselect
         self.selected_layer = None
-        self._update_canvas()
+        self._request_render()
 
     def _on_canvas_drag(self, event):
         """Handle canvas drag - move selected layer."""
@@ -532,30 +835,37 @@ class EditorWindow:
         new_x = self.drag_start[2] + dx
         new_y = self.drag_start[3] + dy
 
-        self.layers[self.selected_layer]['position'] = (new_x, new_y)
+        self.layers[self.selected_layer].position = (new_x, new_y)
         self._sync_controls_from_layers()
-        self._update_canvas()
+        self._request_render()
         self._update_status(f"{self.selected_layer.capitalize()}: ({new_x}, {new_y})")
 
     def _on_canvas_release(self, event):
         """Handle canvas release."""
         self.drag_start = None
 
+        # Replace the drag preview with a full-quality render
+        if self._interactive:
+            self._interactive = False
+            self._request_render()
+
     def _on_mouse_wheel(self, event):
         """Handle mouse wheel - zoom or scale screenshot."""
         if self.selected_layer == 'screenshot' and 'screenshot' in self.layers:
             # Scale screenshot width
             layer = self.layers['screenshot']
             delta = 10 if event.delta > 0 else -10
-            new_width = max(10, layer['size'][0] + delta)
+            new_width = max(10, layer.size[0] + delta)
 
-            # Calculate new height preserving aspect ratio
-            aspect = layer['original_size'][1] / layer['original_size'][0]
-            new_height = int(new_width * aspect)
+            # Calculate new height preserving the cropped aspect ratio (the
+            # width trace no longer recomputes it during the control sync)
+            cropped_w, cropped_h = self._get_cropped_size()
+            new_height = int(new_width * cropped_h / cropped_w)
 
-            layer['size'] = (new_width, new_height)
+            layer.size = (new_width, new_height)
+            self._begin_fast_scaling()
             self._sync_controls_from_layers()
-            self._update_canvas()
+            self._request_render()
         else:
             # Zoom canvas
             delta = 0.1 if event.delta > 0 else -0.1
@@ -564,31 +874,67 @@ class EditorWindow:
     def _adjust_zoom(self, delta):
         """Adjust canvas zoom level."""
         self.zoom = max(0.1, min(2.0, self.zoom + delta))
-        self._update_canvas()
+        self._request_render()
 
     def _fit_zoom(self):
         """Fit zoom to show entire image in canvas."""
         if 'background' in self.layers:
             canvas_w = self.canvas.winfo_width()
             canvas_h = self.canvas.winfo_height()
-            img_w, img_h = self.layers['background']['size']
+            img_w, img_h = self.layers['background'].size
 
             if canvas_w > 1 and canvas_h > 1:
                 zoom_w = canvas_w / img_w
                 zoom_h = canvas_h / img_h
                 self.zoom = min(zoom_w, zoom_h, 1.0) * 0.95  # 95% to leave margin
-                self._update_canvas()
+                self._request_render()
 
     def _nudge(self, dx, dy):
-        """Nudge selected layer by dx, dy pixels."""
+        """Nudge selected layer by dx, dy pixels.
+
+        Key repeats within NUDGE_BATCH_MS are merged and applied as one move.
+        """
+        if not self.selected_layer or self.selected_layer not in self.layers:
+            return
+
+        self._pending_nudge[0] += dx
+        self._pending_nudge[1] += dy
+        if self._nudge_job is None:
+            self._nudge_job = self.root.after(NUDGE_BATCH_MS, self._flush_nudge)
+
+    def _flush_nudge(self):
+        """Apply the accumulated nudge to the selected layer."""
+        self._nudge_job = None
+        dx, dy = self._pending_nudge
+        self._pending_nudge = [0, 0]
         if not self.selected_layer or self.selected_layer not in self.layers:
             return
 
         layer = self.layers[self.selected_layer]
-        x, y = layer['position']
-        layer['position'] = (x + dx, y + dy)
+        x, y = layer.position
+        layer.position = (x + dx, y + dy)
         self._sync_controls_from_layers()
-        self._update_canvas()
+        self._request_render()
+
+    def _debounce(self, key, handler, *args):
+        """Run a spinbox handler once its value stopped changing.
+
+        Each call for the same key cancels the pending one, so typing
+        "1024" triggers a single update instead of four. Writes made by
+        _sync_controls_from_layers are ignored.
+        """
+        if self._syncing:
+            return
+
+        job = self._debounce_ids.get(key)
+        if job is not None:
+            self.root.after_cancel(job)
+        self._debounce_ids[key] = self.root.after(DEBOUNCE_DELAY_MS, self._run_debounced, key, handler, *args)
+
+    def _run_debounced(self, key, handler, *args):
+        """Run a debounced handler and forget its pending job."""
+        self._debounce_ids.pop(key, None)
+        handler(*args)
 
     def _on_position_change(self, layer_name, axis, var):
         """Handle position spinbox change."""
@@ -601,14 +947,14 @@ class EditorWindow:
             return
 
         layer = self.layers[layer_name]
-        x, y = layer['position']
+        x, y = layer.position
 
         if axis == 'x':
-            layer['position'] = (value, y)
+            layer.position = (value, y)
         else:
-            layer['position'] = (x, value)
+            layer.position = (x, value)
 
-        self._update_canvas()
+        self._request_render()
 
     def _on_width_change(self, var):
         """Handle screenshot width spinbox change."""
@@ -629,12 +975,13 @@ class EditorWindow:
         if cropped_size[0] > 0:
             aspect = cropped_size[1] / cropped_size[0]
         else:
-            aspect = layer['original_size'][1] / layer['original_size'][0]
+            aspect = layer.original_size[1] / layer.original_size[0]
         new_height = int(new_width * aspect)
 
-        layer['size'] = (new_width, new_height)
+        layer.size = (new_width, new_height)
+        self._begin_fast_scaling()
         self.layer_vars['screenshot']['height'].set(new_height)
-        self._update_canvas()
+        self._request_render()
 
     def _on_crop_change(self):
         """Handle crop spinbox change."""
@@ -646,6 +993,8 @@ class EditorWindow:
         except tk.TclError:
             return
 
+        self._begin_fast_scaling()
+
         # Update screenshot size to maintain aspect ratio with new crop
         if 'screenshot' in self.layers:
             layer = self.layers['screenshot']
@@ -653,19 +1002,25 @@ class EditorWindow:
             if cropped_size[0] > 0 and cropped_size[1] > 0:
                 # Keep width, recalculate height based on new aspect ratio
                 aspect = cropped_size[1] / cropped_size[0]
-                new_height = int(layer['size'][0] * aspect)
-                layer['size'] = (layer['size'][0], new_height)
+                new_height = int(layer.size[0] * aspect)
+                layer.size = (layer.size[0], new_height)
                 if 'height' in self.layer_vars.get('screenshot', {}):
                     self.layer_vars['screenshot']['height'].set(new_height)
 
-        self._update_canvas()
+        self._request_render()
 
-    def _get_cropped_size(self):
-        """Get the size of the screenshot after cropping."""
-        if 'screenshot' not in self.layers:
-            return (0, 0)
+    def _get_cropped_size(self, original_size=None):
+        """Get the size of the screenshot after cropping.
+
+        Args:
+            original_size: Full screenshot size, defaults to the loaded layer's
+        """
+        if original_size is None:
+            if 'screenshot' not in self.layers:
+                return (0, 0)
+            original_size = self.layers['screenshot'].original_size
 
-        orig_w, orig_h = self.layers['screenshot']['original_size']
+        orig_w, orig_h = original_size
         crop_left = self.crop_settings['left']
         crop_right = self.crop_settings['right']
         crop_top = self.crop_settings['top']
@@ -5,6 +5,13 @@ from __future__ import annotations
 
 import os
 import re
+from functools import lru_cache
+from typing import Iterable
+
+from src.constants import PSD_SUFFIXES
+
+# First run of digits in a filename, e.g. "07" in "screenshot_07"
+_NUMBER_RE = re.compile(r"(\d+)")
 
 
 def extract_screenshot_number(filename: str) -> int | None:
@@ -21,8 +28,9 @@ def extract_screenshot_number(filename: str) -> int | None:
     Returns:
         The extracted screenshot number, or None if no number found.
     """
-    # Remove extension if present
-    name, _ = os.path.splitext(filename)
+    # Remove extension if present (filenames are plain names, so a
+    # rpartition on the last dot is enough)
+    name = filename.rpartition(".")[0] or filename
 
     # First, check if the entire name is a number (e.g., "7")
     if name.isdigit():
@@ -30,8 +38,74 @@ def extract_screenshot_number(filename: str) -> int | None:
 
     # Try to find numbers in the filename using regex
     # This will match patterns like "screenshot_07" or "img_123"
-    match = re.search(r"(\d+)", name)
+    match = _NUMBER_RE.search(name)
     if match:
         return int(match.group(1))
 
     return None
+
+
+def extract_screenshot_numbers(filenames: Iterable[str]) -> list[int | None]:
+    """Extract the screenshot numbers from many filenames at once.
+
+    Gives the same results as calling extract_screenshot_number for each
+    filename, with the per-call lookups hoisted out of the loop.
+
+    Args:
+        filenames: The filenames (with or without extension).
+
+    Returns:
+        The screenshot number for each filename, or None where no number
+        was found, in input order.
+    """
+    search = _NUMBER_RE.search
+    numbers: list[int | None] = []
+    append = numbers.append
+    for filename in filenames:
+        name = filename.rpartition(".")[0] or filename
+        if name.isdigit():
+            append(int(name))
+        else:
+            match = search(name)
+            append(int(match.group(1)) if match else None)
+    return numbers
+
+
+def build_screenshot_index(
+    input_dir: str, suffixes: tuple[str, ...] = PSD_SUFFIXES
+) -> dict[int, list[str]]:
+    """Index the files in a directory by their screenshot number.
+
+    The directory is scanned once; the result is cached until the
+    directory's modification time changes. The returned dictionary is
+    shared between callers and must not be modified.
+
+    Args:
+        input_dir: Directory to scan.
+        suffixes: File suffixes to include (matched with str.endswith).
+
+    Returns:
+        Dictionary mapping screenshot numbers to file paths, sorted by name.
+        Files without a number are not included.
+    """
+    return _build_screenshot_index(input_dir, os.stat(input_dir).st_mtime_ns, suffixes)
+
+
+@lru_cache(maxsize=16)
+def _build_screenshot_index(
+    input_dir: str, mtime_ns: int, suffixes: tuple[str, ...]
+) -> dict[int, list[str]]:
+    """Scan a directory for build_screenshot_index (cached by mtime)."""
+    with os.scandir(input_dir) as entries:
+        matching = sorted(
+            (entry for entry in entries if entry.name.endswith(suffixes) and entry.is_file()),
+            key=lambda entry: entry.name,
+        )
+
+    numbers = extract_screenshot_numbers([entry.name for entry in matching])
+
+    index: dict[int, list[str]] = {}
+    for entry, screenshot_num in zip(matching, numbers):
+        if screenshot_num is not None:
+            index.setdefault(screenshot_num, []).append(entry.path)
+    return index
@@ -0,0 +1,41 @@
+"""
+Filesystem utility functions for the Screenshot Cropper application.
+"""
+from __future__ import annotations
+
+import os
+
+# Directories already ensured during the current run
+_ensured_dirs: set[str] = set()
+
+
+def reset_ensured_dirs() -> None:
+    """Forget the directories ensured so far.
+
+    Called at the start of each run, so directories removed since an
+    earlier run in the same process are created again.
+    """
+    _ensured_dirs.clear()
+
+
+def ensure_dir(path: str) -> bool:
+    """Create a directory (including parents) at most once per run.
+
+    Repeated calls for the same path return immediately without touching
+    the filesystem, which keeps per-locale loops free of redundant stats.
+    The memo is cleared by reset_ensured_dirs() at the start of a run.
+
+    Args:
+        path: Directory path to create.
+
+    Returns:
+        True if the directory was created by this call, False if it
+        already existed.
+    """
+    if path in _ensured_dirs:
+        return False
+
+    created = not os.path.isdir(path)
+    os.makedirs(path, exist_ok=True)
+    _ensured_dirs.add(path)
+    return created
@@ -3,17 +3,69 @@ Image compositor module for the Screenshot Cropper application.
 """
 import logging
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from PIL import Image
 
+from src.fs_utils import ensure_dir
+
 logger = logging.getLogger("screenshot_cropper")
 
+
+def load_layer_image(path, mode=None):
+    """
+    Get a decoded background or overlay image, decoding each file only once.
+
+    The image is cached until the file's modification time or size changes.
+    It is shared between calls and threads and must not be modified.
+
+    Args:
+        path (str): Path to the image file
+        mode (str, optional): Mode to convert the image to, e.g. "RGBA"
+
+    Returns:
+        PIL.Image: The decoded image
+    """
+    stat = os.stat(path)
+    return _decode_layer_image(path, stat.st_mtime_ns, stat.st_size, mode)
+
+
+@lru_cache(maxsize=8)
+def _decode_layer_image(path, mtime_ns, size, mode):
+    """Decode an image for load_layer_image (cached by mtime and size)."""
+    with Image.open(path) as img:
+        if mode and img.mode != mode:
+            return img.convert(mode)
+        return img.copy()
+
+
+def _resize(img, size):
+    """
+    Resize an image, skipping the resample when it already has the size.
+
+    Every other size goes through the same resize call and default filter,
+    so all outputs of a batch are filtered alike.
+
+    Args:
+        img (PIL.Image): The image to resize
+        size (tuple): Target (width, height)
+
+    Returns:
+        PIL.Image: The resized image (may be img itself; don't modify it)
+    """
+    if img.size == tuple(size):
+        return img
+    return img.resize(size)
+
+
 class ImageCompositor:
     """
     Handles the composition of images with background and text overlay.
     This class ensures consistent processing for both regular images and PSD exports.
     """
 
-    def __init__(self, crop_settings, background_settings=None, text_processor=None, base_dir=None, overlay_settings=None, export_settings=None, output_dir=None):
+    def __init__(self, crop_settings, background_settings=None, text_processor=None, base_dir=None, overlay_settings=None, export_settings=None, output_dir=None, save_workers=None):
         """
         Initialize the ImageCompositor.
 
@@ -25,6 +77,9 @@ class ImageCompositor:
             overlay_settings (OverlaySettings, optional): Settings for overlay image
             export_settings (ExportSettings, optional): Settings for export format and quality
             output_dir (str, optional): Base output directory for saving cropped images
+            save_workers (int, optional): Number of background writer threads, and
+                the maximum number of images waiting to be written. Defaults to
+                the number of CPUs.
         """
         self.crop_settings = crop_settings
         self.background_settings = background_settings
@@ -33,6 +88,65 @@ class ImageCompositor:
         self.overlay_settings = overlay_settings
         self.export_settings = export_settings
         self.output_dir = output_dir
+        self._pending_saves = []
+
+        # Background writer pool: encoding and writing a finished image overlaps
+        # with decoding and compositing the next one. The semaphore bounds the
+        # images held in memory while waiting to be written; callers block in
+        # _queue_save once every writer is busy. The pool is started on the
+        # first save and stopped again by close().
+        self._save_workers = save_workers or os.cpu_count() or 1
+        self._save_pool = None
+        self._save_slots = threading.BoundedSemaphore(self._save_workers)
+
+        # Crop margins as (left, top, right, bottom) for the per-image crop box
+        self._crop_margins = (crop_settings.left, crop_settings.top, crop_settings.right, crop_settings.bottom)
+
+        # Background/overlay paths that don't depend on the processed image
+        # are resolved once here; None means resolve per image
+        self._bg_path = self._resolve_input_path(background_settings.file) if background_settings else None
+        self._overlay_path = self._resolve_input_path(overlay_settings.file) if overlay_settings else None
+
+    def _resolve_input_path(self, filename, image_path=None):
+        """
+        Resolve the path of a background or overlay file.
+
+        Args:
+            filename (str): Absolute path, or file name inside the input directory
+            image_path (str, optional): Image being processed, used to find the
+                input directory when no base directory is set
+
+        Returns:
+            str: Resolved path, or None if it depends on an image path that
+                was not given
+        """
+        if os.path.isabs(filename):
+            # Use absolute path directly
+            return filename
+        if self.base_dir:
+            # Use the provided base directory
+            return os.path.join(self.base_dir, "input", filename)
+        if image_path is None:
+            return None
+        # Try to determine the base directory from the image path
+        # This works for regular images but might not work for temporary files
+        input_dir = os.path.dirname(os.path.dirname(image_path))
+        return os.path.join(input_dir, "input", filename)
+
+    def _get_actual_output_path(self, output_path):
+        """
+        Get the path an image will be saved to, based on the export format.
+
+        Args:
+            output_path (str): Requested output path
+
+        Returns:
+            str: Output path with the extension of the configured format
+        """
+        if self.export_settings:
+            base, _ = os.path.splitext(output_path)
+            return f"{base}.{self.export_settings.format}"
+        return output_path
 
     def _save_image(self, img, output_path):
         """
@@ -45,11 +159,9 @@ class ImageCompositor:
         Returns:
             str: The actual output path used (may have different extension)
         """
-        if self.export_settings:
-            # Change extension based on format
-            base, _ = os.path.splitext(output_path)
-            output_path = f"{base}.{self.export_settings.format}"
+        output_path = self._get_actual_output_path(output_path)
 
+        if self.export_settings:
             if self.export_settings.format == "webp":
                 if self.export_settings.lossless:
                     # Lossless WebP preserves transparency
@@ -57,12 +169,72 @@ class ImageCompositor:
                 else:
                     img.save(output_path, "WEBP", quality=self.export_settings.quality)
             else:
-                img.save(output_path, "PNG")
+                img.save(output_path, "PNG", compress_level=self.export_settings.compress_level, optimize=False)
         else:
             img.save(output_path)
 
         return output_path
 
+    def _queue_save(self, img, output_path):
+        """
+        Save image with configured format and quality on the background writer pool.
+
+        The image must not be modified after it has been queued. Blocks while
+        save_workers images are already being written.
+
+        Args:
+            img (PIL.Image): The image to save
+            output_path (str): Path to save the image
+
+        Returns:
+            str: The actual output path that will be written
+        """
+        if self._save_pool is None:
+            self._save_pool = ThreadPoolExecutor(max_workers=self._save_workers, thread_name_prefix="image-save")
+        self._save_slots.acquire()
+        try:
+            future = self._save_pool.submit(self._save_image, img, output_path)
+        except BaseException:
+            self._save_slots.release()
+            raise
+        # Free the slot as soon as the write is done, successful or not
+        future.add_done_callback(lambda _: self._save_slots.release())
+        self._pending_saves.append((future, output_path))
+        return self._get_actual_output_path(output_path)
+
+    def wait_for_saves(self):
+        """
+        Wait for all queued saves to finish.
+
+        Returns:
+            int: Number of saves that failed.
+        """
+        pending, self._pending_saves = self._pending_saves, []
+        failed_count = 0
+        for future, output_path in pending:
+            try:
+                future.result()
+            except Exception as e:
+                logger.error(f"Failed to save image {output_path}: {e}")
+                failed_count += 1
+        return failed_count
+
+    def close(self):
+        """
+        Wait for all queued saves to finish and stop the writer threads.
+
+        The compositor can still be used afterwards; the next save starts a
+        new pool.
+
+        Returns:
+            int: Number of saves that failed.
+        """
+        failed_count = self.wait_for_saves()
+        if self._save_pool is not None:
+            self._save_pool.shutdown()
+            self._save_pool = None
+        return failed_count
+
     def _save_cropped_image(self, cropped_img, output_path, locale=None):
         """
         Save the cropped image to the cropped subfolder.
@@ -83,8 +255,7 @@ class ImageCompositor:
             cropped_dir = os.path.join(self.output_dir, "cropped")
 
         # Create directory if it doesn't exist
-        if not os.path.exists(cropped_dir):
-            os.makedirs(cropped_dir)
+        if ensure_dir(cropped_dir):
             logger.info(f"Created cropped output directory: {cropped_dir}")
 
         cropped_path = os.path.join(cropped_dir, filename)
@@ -109,54 +280,55 @@ class ImageCompositor:
         Returns:
             bool: True if processing was successful
         """
+        image_name = os.path.basename(image_path)
         try:
-            logger.info(f"Processing image: {os.path.basename(image_path)}")
-            logger.info(f"Output path: {output_path}")
-            
-            # Log text and locale parameters
-            if text:
-                logger.info(f"Text to overlay: '{text}'")
-            else:
-                logger.info("No text to overlay")
-                
-            if locale:
-                logger.info(f"Locale: {locale}")
-            else:
-                logger.info("No locale specified")
-            
-            # Log background settings
-            if self.background_settings:
-                logger.info(f"Background settings: file={self.background_settings.file}, "
-                           f"position=({self.background_settings.position_x}, {self.background_settings.position_y}), "
-                           f"size=({self.background_settings.width}, {self.background_settings.height})")
-            else:
-                logger.info("No background settings")
-                
-            # Log text processor
-            if self.text_processor:
-                logger.info("Text processor is available")
-            else:
-                logger.info("No text processor")
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("Processing image: %s", image_name)
+                logger.info("Output path: %s", output_path)
+
+                # Log text and locale parameters
+                if text:
+                    logger.info("Text to overlay: '%s'", text)
+                else:
+                    logger.info("No text to overlay")
+
+                if locale:
+                    logger.info("Locale: %s", locale)
+                else:
+                    logger.info("No locale specified")
+
+                # Log background settings
+                if self.background_settings:
+                    logger.info("Background settings: file=%s, position=(%s, %s), size=(%s, %s)",
+                                self.background_settings.file,
+                                self.background_settings.position_x, self.background_settings.position_y,
+                                self.background_settings.width, self.background_settings.height)
+                else:
+                    logger.info("No background settings")
+
+                # Log text processor
+                if self.text_processor:
+                    logger.info("Text processor is available")
+                else:
+                    logger.info("No text processor")
             
             # Open image
             with Image.open(image_path) as img:
                 # Get image dimensions
                 width, height = img.size
                 
-                # Calculate crop box
-                left = self.crop_settings.left
-                top = self.crop_settings.top
-                right = width - self.crop_settings.right if self.crop_settings.right > 0 else width
-                bottom = height - self.crop_settings.bottom if self.crop_settings.bottom > 0 else height
+                # Calculate crop box (margins are clamped to >= 0)
+                left, top, right_margin, bottom_margin = self._crop_margins
+                right, bottom = width - right_margin, height - bottom_margin
                 
                 # Ensure valid crop box
                 if left >= right or top >= bottom:
-                    logger.warning(f"Invalid crop box for {os.path.basename(image_path)}: {left}, {top}, {right}, {bottom}")
+                    logger.warning("Invalid crop box for %s: %s, %s, %s, %s", image_name, left, top, right, bottom)
                     logger.warning("Skipping crop for this image")
                     cropped_img = img.copy()
                 else:
                     # Crop image
-                    logger.info(f"Cropping image: {left}, {top}, {right}, {bottom}")
+                    logger.info("Cropping image: %s, %s, %s, %s", left, top, right, bottom)
                     cropped_img = img.crop((left, top, right, bottom))
 
                 # Save cropped image separately if keep_cropped is enabled
@@ -166,97 +338,83 @@ class ImageCompositor:
                 if self.background_settings:
                     try:
                         # Get the path to the background image
-                        if os.path.isabs(self.background_settings.file):
-                            # Use absolute path directly
-                            bg_path = self.background_settings.file
-                        elif self.base_dir:
-                            # Use the provided base directory
-                            bg_path = os.path.join(self.base_dir, "input", self.background_settings.file)
-                        else:
-                            # Try to determine the base directory from the image path
-                            # This works for regular images but might not work for temporary files
-                            input_dir = os.path.dirname(os.path.dirname(image_path))
-                            bg_path = os.path.join(input_dir, "input", self.background_settings.file)
+                        bg_path = self._bg_path or self._resolve_input_path(self.background_settings.file, image_path)
                         
-                        logger.info(f"Loading background image from: {bg_path}")
+                        logger.info("Loading background image from: %s", bg_path)
                         
                         # Check if background image exists
                         if not os.path.isfile(bg_path):
-                            logger.error(f"Background image not found: {bg_path}")
+                            logger.error("Background image not found: %s", bg_path)
                             # Save just the cropped image
-                            actual_path = self._save_image(cropped_img, output_path)
-                            logger.info(f"Saved cropped image to: {actual_path}")
+                            actual_path = self._queue_save(cropped_img, output_path)
+                            logger.info("Queued cropped image for saving: %s", actual_path)
                             return True
                         
-                        # Open background image
-                        with Image.open(bg_path) as bg_img:
-                            # Resize cropped image to specified width while maintaining aspect ratio
-                            original_width, original_height = cropped_img.size
-                            aspect_ratio = original_height / original_width
-                            new_width = self.background_settings.width
-                            new_height = int(new_width * aspect_ratio)
+                        # Get the background image (decoded once and shared
+                        # between calls, so the composite is built on a copy)
+                        bg_img = load_layer_image(bg_path)
+
+                        # Resize cropped image to specified width while maintaining aspect ratio
+                        original_width, original_height = cropped_img.size
+                        aspect_ratio = original_height / original_width
+                        new_width = self.background_settings.width
+                        new_height = int(new_width * aspect_ratio)
                             
-                            logger.info(f"Resizing image from {original_width}x{original_height} to {new_width}x{new_height} (maintaining aspect ratio)")
-                            resized_img = cropped_img.resize((new_width, new_height))
+                        logger.info("Resizing image from %sx%s to %sx%s (maintaining aspect ratio)",
+                                    original_width, original_height, new_width, new_height)
+                        resized_img = _resize(cropped_img, (new_width, new_height))
                             
-                            # Create a copy of the background
-                            final_img = bg_img.copy()
+                        final_img = bg_img.copy()
                             
-                            # Paste cropped image onto background
-                            final_img.paste(resized_img, (self.background_settings.position_x, self.background_settings.position_y))
+                        # Paste cropped image onto background
+                        final_img.paste(resized_img, (self.background_settings.position_x, self.background_settings.position_y))
                             
-                            # If text processor and text are provided, draw text
-                            if self.text_processor and text:
-                                logger.info(f"Drawing text '{text}' with locale '{locale}'")
-                                final_img = self.text_processor.draw_text(final_img, text, locale)
-                                logger.info("Text drawing completed")
-                            elif self.text_processor:
-                                logger.info("Text processor available but no text to draw")
-                            elif text:
-                                logger.warning("Text provided but no text processor available")
-
-                            # Apply overlay if configured
-                            if self.overlay_settings:
-                                # Find overlay path (same logic as background)
-                                if os.path.isabs(self.overlay_settings.file):
-                                    overlay_path = self.overlay_settings.file
-                                elif self.base_dir:
-                                    overlay_path = os.path.join(self.base_dir, "input", self.overlay_settings.file)
-                                else:
-                                    input_dir = os.path.dirname(os.path.dirname(image_path))
-                                    overlay_path = os.path.join(input_dir, "input", self.overlay_settings.file)
-
-                                if os.path.isfile(overlay_path):
-                                    logger.info(f"Applying overlay from: {overlay_path}")
-                                    overlay_img = Image.open(overlay_path).convert("RGBA")
-                                    # Convert final_img to RGBA if needed
-                                    if final_img.mode != "RGBA":
-                                        final_img = final_img.convert("RGBA")
-                                    # Paste with alpha transparency
-                                    final_img.paste(
-                                        overlay_img,
-                                        (self.overlay_settings.position_x, self.overlay_settings.position_y),
-                                        overlay_img  # Third arg = alpha mask
-                                    )
-                                    logger.info("Overlay applied successfully")
-                                else:
-                                    logger.warning(f"Overlay image not found: {overlay_path}")
-
-                            # Save final image
-                            actual_path = self._save_image(final_img, output_path)
-                            logger.info(f"Saved composite image to: {actual_path}")
+                        # If text processor and text are provided, draw text
+                        if self.text_processor and text:
+                            logger.info("Drawing text '%s' with locale '%s'", text, locale)
+                            final_img = self.text_processor.draw_text(final_img, text, locale)
+                            logger.info("Text drawing completed")
+                        elif self.text_processor:
+                            logger.info("Text processor available but no text to draw")
+                        elif text:
+                            logger.warning("Text provided but no text processor available")
+
+                        # Apply overlay if configured
+                        if self.overlay_settings:
+                            # Find overlay path (same logic as background)
+                            overlay_path = self._overlay_path or self._resolve_input_path(self.overlay_settings.file, image_path)
+
+                            if os.path.isfile(overlay_path):
+                                logger.info("Applying overlay from: %s", overlay_path)
+                                overlay_img = load_layer_image(overlay_path, "RGBA")
+                                # Convert final_img to RGBA if needed
+                                if final_img.mode != "RGBA":
+                                    final_img = final_img.convert("RGBA")
+                                # Paste with alpha transparency
+                                final_img.paste(
+                                    overlay_img,
+                                    (self.overlay_settings.position_x, self.overlay_settings.position_y),
+                                    overlay_img  # Third arg = alpha mask
+                                )
+                                logger.info("Overlay applied successfully")
+                            else:
+                                logger.warning("Overlay image not found: %s", overlay_path)
+
+                        # Save final image
+                        actual_path = self._queue_save(final_img, output_path)
+                        logger.info("Queued composite image for saving: %s", actual_path)
                     except Exception as e:
-                        logger.error(f"Error applying background to {os.path.basename(image_path)}: {e}")
+                        logger.error("Error applying background to %s: %s", image_name, e)
                         # Save just the cropped image as fallback
-                        actual_path = self._save_image(cropped_img, output_path)
-                        logger.info(f"Saved cropped image to: {actual_path}")
+                        actual_path = self._queue_save(cropped_img, output_path)
+                        logger.info("Queued cropped image for saving: %s", actual_path)
                 else:
                     # Save just the cropped image
-                    actual_path = self._save_image(cropped_img, output_path)
-                    logger.info(f"Saved cropped image to: {actual_path}")
+                    actual_path = self._queue_save(cropped_img, output_path)
+                    logger.info("Queued cropped image for saving: %s", actual_path)
             
             return True
             
         except Exception as e:
-            logger.error(f"Error processing image {os.path.basename(image_path)}: {e}")
+            logger.error("Error processing image %s: %s", image_name, e)
             return False
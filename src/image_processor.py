@@ -1,22 +1,38 @@
 """
 Image processor module for the Screenshot Cropper application.
 """
+import functools
 import logging
 import os
 import os.path
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 from adobe_document_handler import PSDProcessor
 from PIL import Image
 
 from src.image_compositor import ImageCompositor
 from src.filename_utils import extract_screenshot_number
+from src.fs_utils import ensure_dir
 
 logger = logging.getLogger("screenshot_cropper")
 
+# Freed Pillow memory blocks kept for reuse between screenshots. Pillow
+# allocates image memory in blocks of up to 16 MiB (PILLOW_BLOCK_SIZE), so
+# this retains at most 8 * 16 MiB = 128 MiB after large images are freed,
+# for the rest of the process.
+IMAGE_BLOCKS_MAX = 8
+
+
+@functools.lru_cache(maxsize=1)
+def _set_image_blocks_max():
+    """Apply IMAGE_BLOCKS_MAX to Pillow's process-wide block cache, once."""
+    Image.core.set_blocks_max(IMAGE_BLOCKS_MAX)
+
+
 class ImageProcessor:
     """Handler for image processing operations."""
 
-    def __init__(self, input_dir, output_dir, crop_settings, background_settings=None, text_processor=None, locale_handler=None, screenshot_filter=None, skip_existing=False, overlay_settings=None, export_settings=None):
+    def __init__(self, input_dir, output_dir, crop_settings, background_settings=None, text_processor=None, locale_handler=None, screenshot_filter=None, skip_existing=False, overlay_settings=None, export_settings=None, max_workers=None):
         """
         Initialize the ImageProcessor.
 
@@ -31,6 +47,8 @@ class ImageProcessor:
             skip_existing (bool, optional): Skip processing if output file already exists.
             overlay_settings (OverlaySettings, optional): Overlay settings to apply.
             export_settings (ExportSettings, optional): Export format and quality settings.
+            max_workers (int, optional): Number of worker threads for image processing.
+                Defaults to the number of CPUs.
         """
         self.input_dir = input_dir
         self.output_dir = output_dir
@@ -42,6 +60,12 @@ class ImageProcessor:
         self.skip_existing = skip_existing
         self.overlay_settings = overlay_settings
         self.export_settings = export_settings
+        self.max_workers = max_workers or os.cpu_count() or 1
+
+        # Let Pillow's memory arena keep a few freed image blocks so the next
+        # screenshot reuses them instead of allocating fresh buffers
+        _set_image_blocks_max()
+
         self.supported_extensions = ('.png', '.jpg', '.jpeg', '.psd')
 
         # Get text settings from text processor if available
@@ -55,7 +79,7 @@ class ImageProcessor:
         # Initialize image compositor for consistent image processing
         # Pass the directory containing the input and output directories as the base directory
         base_dir = os.path.dirname(os.path.dirname(input_dir))
-        self.image_compositor = ImageCompositor(crop_settings, background_settings, text_processor, base_dir, overlay_settings, export_settings, output_dir)
+        self.image_compositor = ImageCompositor(crop_settings, background_settings, text_processor, base_dir, overlay_settings, export_settings, output_dir, save_workers=self.max_workers)
         logger.info(f"Initialized image compositor with base directory: {base_dir}")
 
     def _get_output_extension(self):
@@ -71,6 +95,23 @@ class ImageProcessor:
         Returns:
             int: Number of successfully processed images.
         """
+        try:
+            processed_count = self._process_image_files()
+        finally:
+            # Outputs are written on a background pool; stop it once they are
+            # all written, even if processing failed
+            failed_count = self.image_compositor.close()
+
+        # Don't count failed writes
+        return processed_count - failed_count
+
+    def _process_image_files(self):
+        """
+        Process all images in the input directory, queueing their saves.
+
+        Returns:
+            int: Number of processed images, including queued saves.
+        """
         processed_count = 0
 
         # Get list of image files
@@ -104,7 +145,8 @@ class ImageProcessor:
                     except Exception as e:
                         logger.error(f"Failed to process PSD file {psd_file} for all locales: {e}")
 
-                # Process regular image files (one locale at a time)
+                # Process regular image files (one task per image and locale)
+                tasks = []
                 for i, image_file in enumerate(regular_files):
                     filename = os.path.basename(image_file)
                     screenshot_num = extract_screenshot_number(filename)
@@ -124,33 +166,76 @@ class ImageProcessor:
                                 processed_count += 1  # Count as processed (skipped)
                                 continue
 
-                        logger.info(f"Processing image {filename} (index: {text_index}, add_one: {add_one}) for locale {locale}")
+                        logger.info(f"Queueing image {filename} (index: {text_index}, add_one: {add_one}) for locale {locale}")
                         text = self.locale_handler.get_text(locale, text_index, add_one=add_one)
-                        try:
-                            self._process_image(image_file, locale=locale, text=text)
-                            processed_count += 1
-                        except Exception as e:
-                            logger.error(f"Failed to process image {image_file} for locale {locale}: {e}")
+                        tasks.append((image_file, locale, text))
+
+                processed_count += self._process_tasks(tasks)
             else:
                 logger.warning("No locales found, processing images without text")
                 # No locales, process normally
-                for image_file in image_files:
-                    try:
-                        self._process_image(image_file)
-                        processed_count += 1
-                    except Exception as e:
-                        logger.error(f"Failed to process image {image_file}: {e}")
+                processed_count += self._process_tasks([(image_file, None, None) for image_file in image_files])
         else:
             # No text settings or locale handler, process normally
-            for image_file in image_files:
-                try:
-                    self._process_image(image_file)
-                    processed_count += 1
-                except Exception as e:
-                    logger.error(f"Failed to process image {image_file}: {e}")
+            processed_count += self._process_tasks([(image_file, None, None) for image_file in image_files])
 
         return processed_count
-    
+
+    def _process_tasks(self, tasks):
+        """
+        Process (image_path, locale, text) tasks.
+
+        PSD files go through Photoshop automation and are processed sequentially.
+        Regular images are processed concurrently in a thread pool, since Pillow
+        releases the GIL while decoding and encoding.
+
+        Args:
+            tasks (list): List of (image_path, locale, text) tuples.
+
+        Returns:
+            int: Number of successfully processed tasks.
+        """
+        psd_tasks = [task for task in tasks if task[0].lower().endswith('.psd')]
+        image_tasks = [task for task in tasks if not task[0].lower().endswith('.psd')]
+
+        processed_count = sum(1 for task in psd_tasks if self.process_one(*task))
+
+        if image_tasks:
+            workers = min(self.max_workers, len(image_tasks))
+            logger.info(f"Processing {len(image_tasks)} image tasks with {workers} worker threads")
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = [executor.submit(self.process_one, *task) for task in image_tasks]
+                for future in as_completed(futures):
+                    if future.result():
+                        processed_count += 1
+
+        return processed_count
+
+    def process_one(self, image_path, locale=None, text=None):
+        """
+        Process a single image for a single locale.
+
+        Safe to call from worker threads: every call opens its own image and
+        writes to its own output path.
+
+        Args:
+            image_path (str): Path to the image file.
+            locale (str, optional): Locale code for text overlay.
+            text (str, optional): Text to overlay on the image.
+
+        Returns:
+            bool: True if processing was successful.
+        """
+        try:
+            self._process_image(image_path, locale=locale, text=text)
+            return True
+        except Exception as e:
+            if locale:
+                logger.error(f"Failed to process image {image_path} for locale {locale}: {e}")
+            else:
+                logger.error(f"Failed to process image {image_path}: {e}")
+            return False
+
     def _get_image_files(self):
         """
         Get list of image files in the input directory.
@@ -160,20 +245,22 @@ class ImageProcessor:
         """
         image_files = []
 
-        for filename in os.listdir(self.input_dir):
-            file_path = os.path.join(self.input_dir, filename)
-
-            # Check if it's a file and has a supported extension
-            if os.path.isfile(file_path) and filename.lower().endswith(self.supported_extensions):
-                # If screenshot filter is set, only include files with matching number
-                if self.screenshot_filter is not None:
-                    screenshot_num = extract_screenshot_number(filename)
-                    if screenshot_num == self.screenshot_filter:
-                        image_files.append(file_path)
+        # scandir returns the file type with each entry, so no extra stat per file
+        with os.scandir(self.input_dir) as entries:
+            for entry in entries:
+                filename = entry.name
+
+                # Check if it has a supported extension and is a file
+                if filename.lower().endswith(self.supported_extensions) and entry.is_file():
+                    # If screenshot filter is set, only include files with matching number
+                    if self.screenshot_filter is not None:
+                        screenshot_num = extract_screenshot_number(filename)
+                        if screenshot_num == self.screenshot_filter:
+                            image_files.append(entry.path)
+                        else:
+                            logger.debug(f"Skipping file '{filename}' (filter: {self.screenshot_filter})")
                     else:
-                        logger.debug(f"Skipping file '{filename}' (filter: {self.screenshot_filter})")
-                else:
-                    image_files.append(file_path)
+                        image_files.append(entry.path)
 
         return image_files
 
@@ -207,8 +294,7 @@ class ImageProcessor:
         output_ext = self._get_output_extension()
         for locale in locales:
             locale_output_dir = os.path.join(self.output_dir, locale)
-            if not os.path.exists(locale_output_dir):
-                os.makedirs(locale_output_dir)
+            if ensure_dir(locale_output_dir):
                 logger.info(f"Created locale-specific output directory: {locale_output_dir}")
 
             output_filename = f"{name}_{locale}{output_ext}"
@@ -312,8 +398,7 @@ class ImageProcessor:
         if locale:
             # Create locale-specific subdirectory
             locale_output_dir = os.path.join(self.output_dir, locale)
-            if not os.path.exists(locale_output_dir):
-                os.makedirs(locale_output_dir)
+            if ensure_dir(locale_output_dir):
                 logger.info(f"Created locale-specific output directory: {locale_output_dir}")
 
             output_filename = f"{name}_{locale}{output_ext}"
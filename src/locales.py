@@ -0,0 +1,29 @@
+"""
+Shared locale handlers for the Screenshot Cropper application.
+"""
+from __future__ import annotations
+
+import functools
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from adobe_document_handler import LocaleHandler
+
+
+@functools.lru_cache(maxsize=8)
+def get_locale_handler(locales_dir: str, language_filter: str | None) -> LocaleHandler:
+    """Get the locale handler for a directory and language filter.
+
+    Handlers are cached per (locales_dir, language_filter), so every
+    pipeline in a process shares one parsed set of locale files.
+
+    Args:
+        locales_dir: Directory containing locale files.
+        language_filter: Optional language filter.
+
+    Returns:
+        Locale handler for the directory.
+    """
+    from adobe_document_handler import LocaleHandler
+
+    return LocaleHandler(locales_dir, language_filter)
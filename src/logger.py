@@ -3,13 +3,20 @@ Logger module for the Screenshot Cropper application.
 """
 from __future__ import annotations
 
+import atexit
 import logging
+import logging.handlers
+import queue
 import sys
 
 
 def setup_logger() -> logging.Logger:
     """Set up and configure the logger.
 
+    Records are handed to a queue and written to the console by a
+    background listener thread, so worker threads never block on
+    console I/O while logging.
+
     Returns:
         Configured logger instance.
     """
@@ -29,7 +36,14 @@ def setup_logger() -> logging.Logger:
     # Add formatter to console handler
     console_handler.setFormatter(formatter)
 
-    # Add console handler to logger
-    logger.addHandler(console_handler)
+    # Route records through a queue; the listener thread owns the console handler
+    log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
+
+    listener = logging.handlers.QueueListener(log_queue, console_handler)
+    listener.start()
+
+    # Flush remaining records on exit, including sys.exit() paths
+    atexit.register(listener.stop)
 
     return logger
@@ -5,13 +5,38 @@ from __future__ import annotations
 
 import logging
 from dataclasses import dataclass, field
+from typing import ClassVar, NamedTuple
 
 from src.constants import ALIGN, FORMATS
 
 logger = logging.getLogger("screenshot_cropper")
 
+# Allowed values, built once instead of per validated instance
+VALID_FORMATS = frozenset({FORMATS.PNG, FORMATS.WEBP})
+VALID_H_ALIGNS = frozenset({ALIGN.LEFT, ALIGN.CENTER, ALIGN.RIGHT})
+VALID_V_ALIGNS = frozenset({ALIGN.TOP, ALIGN.MIDDLE, ALIGN.BOTTOM})
 
-@dataclass
+# (field name, lower bound, replacement when out of range, whether the bound
+# itself is invalid). The bound is compared as given, so JSON floats such as
+# 0.5 are checked against it like the original "< 0" / "<= 0" tests.
+FieldCheck = tuple[str, int, int, bool]
+
+
+def _clamp_fields(settings: object, checks: tuple[FieldCheck, ...]) -> None:
+    """Replace numeric fields that fall below or on their lower bound.
+
+    Args:
+        settings: Settings instance to validate in place.
+        checks: Field checks to apply.
+    """
+    for name, bound, default, exclusive in checks:
+        value = getattr(settings, name)
+        if (value <= bound) if exclusive else (value < bound):
+            logger.warning("Invalid %s value: %s, setting to %s", name, value, default)
+            object.__setattr__(settings, name, default)
+
+
+@dataclass(frozen=True, slots=True)
 class CropSettings:
     """Settings for image cropping."""
     top: int
@@ -19,27 +44,23 @@ class CropSettings:
     right: int = 0
     bottom: int = 0
 
+    _CHECKS: ClassVar[tuple[FieldCheck, ...]] = (
+        ("top", 0, 0, False),
+        ("left", 0, 0, False),
+        ("right", 0, 0, False),
+        ("bottom", 0, 0, False),
+    )
+
     def __post_init__(self) -> None:
         """Validate settings after initialization."""
         self._validate()
 
     def _validate(self) -> None:
         """Validate crop settings."""
-        if self.top < 0:
-            logger.warning(f"Invalid top value: {self.top}, setting to 0")
-            object.__setattr__(self, "top", 0)
-        if self.left < 0:
-            logger.warning(f"Invalid left value: {self.left}, setting to 0")
-            object.__setattr__(self, "left", 0)
-        if self.right < 0:
-            logger.warning(f"Invalid right value: {self.right}, setting to 0")
-            object.__setattr__(self, "right", 0)
-        if self.bottom < 0:
-            logger.warning(f"Invalid bottom value: {self.bottom}, setting to 0")
-            object.__setattr__(self, "bottom", 0)
-
-
-@dataclass
+        _clamp_fields(self, self._CHECKS)
+
+
+@dataclass(frozen=True, slots=True)
 class BackgroundSettings:
     """Settings for background image placement."""
     file: str
@@ -48,54 +69,53 @@ class BackgroundSettings:
     width: int
     height: int
 
+    _CHECKS: ClassVar[tuple[FieldCheck, ...]] = (
+        ("position_x", 0, 0, False),
+        ("position_y", 0, 0, False),
+        ("width", 0, 100, True),
+        ("height", 0, 100, True),
+    )
+
     def __post_init__(self) -> None:
         """Validate settings after initialization."""
         self._validate()
 
     def _validate(self) -> None:
         """Validate background settings."""
-        if self.position_x < 0:
-            logger.warning(f"Invalid position_x value: {self.position_x}, setting to 0")
-            object.__setattr__(self, "position_x", 0)
-        if self.position_y < 0:
-            logger.warning(f"Invalid position_y value: {self.position_y}, setting to 0")
-            object.__setattr__(self, "position_y", 0)
-        if self.width <= 0:
-            logger.warning(f"Invalid width value: {self.width}, setting to 100")
-            object.__setattr__(self, "width", 100)
-        if self.height <= 0:
-            logger.warning(f"Invalid height value: {self.height}, setting to 100")
-            object.__setattr__(self, "height", 100)
-
-
-@dataclass
+        _clamp_fields(self, self._CHECKS)
+
+
+@dataclass(frozen=True, slots=True)
 class OverlaySettings:
     """Settings for overlay image placement."""
     file: str
     position_x: int = 0
     position_y: int = 0
 
+    _CHECKS: ClassVar[tuple[FieldCheck, ...]] = (
+        ("position_x", 0, 0, False),
+        ("position_y", 0, 0, False),
+    )
+
     def __post_init__(self) -> None:
         """Validate settings after initialization."""
         self._validate()
 
     def _validate(self) -> None:
         """Validate overlay settings."""
-        if self.position_x < 0:
-            logger.warning(f"Invalid position_x value: {self.position_x}, setting to 0")
-            object.__setattr__(self, "position_x", 0)
-        if self.position_y < 0:
-            logger.warning(f"Invalid position_y value: {self.position_y}, setting to 0")
-            object.__setattr__(self, "position_y", 0)
+        _clamp_fields(self, self._CHECKS)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ExportSettings:
     """Settings for export format and quality."""
     format: str = FORMATS.PNG
     quality: int = 90
     keep_cropped: bool = False
     lossless: bool = False
+    # zlib level for PNG output; 1 encodes several times faster than
+    # Pillow's default of 6 for slightly larger files
+    compress_level: int = 1
 
     def __post_init__(self) -> None:
         """Validate and normalize settings after initialization."""
@@ -105,16 +125,18 @@ class ExportSettings:
 
     def _validate(self) -> None:
         """Validate export settings."""
-        valid_formats = [FORMATS.PNG, FORMATS.WEBP]
-        if self.format not in valid_formats:
-            logger.warning(f"Invalid format value: {self.format}, setting to '{FORMATS.PNG}'")
+        if self.format not in VALID_FORMATS:
+            logger.warning("Invalid format value: %s, setting to '%s'", self.format, FORMATS.PNG)
             object.__setattr__(self, "format", FORMATS.PNG)
         if self.quality < 1 or self.quality > 100:
-            logger.warning(f"Invalid quality value: {self.quality}, setting to 90")
+            logger.warning("Invalid quality value: %s, setting to 90", self.quality)
             object.__setattr__(self, "quality", 90)
+        if self.compress_level < 0 or self.compress_level > 9:
+            logger.warning("Invalid compress_level value: %s, setting to 1", self.compress_level)
+            object.__setattr__(self, "compress_level", 1)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TextSettings:
     """Settings for text overlay."""
     font_files: dict[str, str]
@@ -128,6 +150,14 @@ class TextSettings:
     color: tuple[int, int, int] = (0, 0, 0)
     font_names: dict[str, str] = field(default_factory=dict)
 
+    _CHECKS: ClassVar[tuple[FieldCheck, ...]] = (
+        ("font_size", 0, 24, True),
+        ("x", 0, 0, False),
+        ("y", 0, 0, False),
+        ("width", 0, 100, True),
+        ("height", 0, 100, True),
+    )
+
     def __post_init__(self) -> None:
         """Validate settings after initialization."""
         self._validate()
@@ -137,29 +167,29 @@ class TextSettings:
         if not isinstance(self.font_files, dict) or "default" not in self.font_files:
             logger.warning("Invalid font_files value, must be a dictionary with a 'default' key")
             object.__setattr__(self, "font_files", {"default": "Arial.ttf"})
-        if self.font_size <= 0:
-            logger.warning(f"Invalid font_size value: {self.font_size}, setting to 24")
-            object.__setattr__(self, "font_size", 24)
 
-        valid_h_aligns = [ALIGN.LEFT, ALIGN.CENTER, ALIGN.RIGHT]
-        if self.align not in valid_h_aligns:
-            logger.warning(f"Invalid align value: {self.align}, setting to '{ALIGN.LEFT}'")
+        if self.align not in VALID_H_ALIGNS:
+            logger.warning("Invalid align value: %s, setting to '%s'", self.align, ALIGN.LEFT)
             object.__setattr__(self, "align", ALIGN.LEFT)
 
-        valid_v_aligns = [ALIGN.TOP, ALIGN.MIDDLE, ALIGN.BOTTOM]
-        if self.vertical_align not in valid_v_aligns:
-            logger.warning(f"Invalid vertical_align value: {self.vertical_align}, setting to '{ALIGN.TOP}'")
+        if self.vertical_align not in VALID_V_ALIGNS:
+            logger.warning("Invalid vertical_align value: %s, setting to '%s'", self.vertical_align, ALIGN.TOP)
             object.__setattr__(self, "vertical_align", ALIGN.TOP)
 
-        if self.x < 0:
-            logger.warning(f"Invalid x value: {self.x}, setting to 0")
-            object.__setattr__(self, "x", 0)
-        if self.y < 0:
-            logger.warning(f"Invalid y value: {self.y}, setting to 0")
-            object.__setattr__(self, "y", 0)
-        if self.width <= 0:
-            logger.warning(f"Invalid width value: {self.width}, setting to 100")
-            object.__setattr__(self, "width", 100)
-        if self.height <= 0:
-            logger.warning(f"Invalid height value: {self.height}, setting to 100")
-            object.__setattr__(self, "height", 100)
+        _clamp_fields(self, self._CHECKS)
+
+
+class SettingsBundle(NamedTuple):
+    """All settings parsed from one configuration file."""
+    crop: CropSettings | None
+    background: BackgroundSettings | None
+    text: TextSettings | None
+    overlay: OverlaySettings | None
+    export: ExportSettings
+
+
+class DirectorySettings(NamedTuple):
+    """Directories configured in the "directories" section (None if unset)."""
+    screenshots: str | None
+    locales: str | None
+    output: str | None
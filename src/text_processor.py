@@ -18,7 +18,6 @@ class TextProcessor:
             text_settings (TextSettings): Text settings to apply.
         """
         self.text_settings = text_settings
-        self.current_locale = None
     
     def draw_text(self, img, text, locale=None):
         """
@@ -37,9 +36,6 @@ class TextProcessor:
         
         logger.info(f"Drawing text: '{text}'")
         
-        # Store the current locale for font selection
-        self.current_locale = locale
-        
         # Select the appropriate font file based on locale
         if locale and locale in self.text_settings.font_files:
             font_file = self.text_settings.font_files[locale]
@@ -142,9 +138,6 @@ class TextProcessor:
             # Move to next line position
             current_y += line_heights[i] + line_spacing
         
-        # Clear the current locale
-        self.current_locale = None
-        
         return img
     
     def _load_font(self, font_file):